@@ -202,12 +202,14 @@ class BaseAgent(BaseConfig, BaseLLM):
             user_message = self._format_request(data)
             
             if self._should_log(LogDetail.DEBUG):
+                system_len = len(system_message)
+                user_len = len(user_message)
                 logger.debug("agent.messages",
-                            system_length=len(system_message),
-                            user_length=len(user_message),
+                            system_length=system_len,
+                            user_length=user_len,
                             agent_execution_id=agent_execution_id,
-                            system=system_message[:10] + "..." if len(system_message) > 10 else system_message,
-                            user_message=user_message[:10] + "..." if len(user_message) > 10 else user_message)
+                            system=system_message[:10] + "..." if system_len > 10 else system_message,
+                            user_message=user_message[:10] + "..." if user_len > 10 else user_message)
                             
             # Create complete messages object for LLM and lineage tracking
             # FIXED: Don't duplicate content between user and formatted_request
@@ -196,13 +196,7 @@ class BaseConfig:
 
     def _should_log(self, level: LogDetail) -> bool:
         """Check if current log level includes the specified detail level"""
-        log_levels = {
-            LogDetail.MINIMAL: 0,
-            LogDetail.BASIC: 1, 
-            LogDetail.DETAILED: 2,
-            LogDetail.DEBUG: 3
-        }
-        return log_levels[level] <= log_levels[self.log_level]
+        return level.rank <= self.log_level.rank
     
     def _update_metrics(self, duration: float, success: bool, error: Optional[str] = None) -> None:
         """Update operation metrics with timing and success information"""
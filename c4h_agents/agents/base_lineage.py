@@ -357,6 +357,8 @@ class BaseLineage:
             
             # Write to temp file first (atomic operation)
             with open(temp_file, 'w') as f:
+                # Stdlib json keeps the file format independent of optional
+                # encoders; default=str must see every non-JSON value
                 json.dump(event_data, f, indent=2, default=str)
                 
             # Rename to final filename (atomic operation)
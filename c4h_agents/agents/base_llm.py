@@ -229,14 +229,5 @@ class BaseLLM:
 
     def _should_log(self, level: LogDetail) -> bool:
         """Check if current log level includes the specified detail level"""
-        log_levels = {
-            LogDetail.MINIMAL: 0,
-            LogDetail.BASIC: 1, 
-            LogDetail.DETAILED: 2,
-            LogDetail.DEBUG: 3
-        }
-        
-        current_level = self.log_level
-        target_level = LogDetail(level) if isinstance(level, str) else level
-        
-        return log_levels[target_level] <= log_levels[current_level]
\ No newline at end of file
+        target_level = level if isinstance(level, LogDetail) else LogDetail(level)
+        return target_level.rank <= self.log_level.rank
\ No newline at end of file
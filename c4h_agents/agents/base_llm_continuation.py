@@ -13,6 +13,7 @@ import litellm
 from litellm import completion
 from c4h_agents.agents.types import LLMProvider, LogDetail
 from c4h_agents.utils.logging import get_logger
+from c4h_agents.utils import json_utils
 
 logger = get_logger()
 
@@ -291,7 +292,7 @@ Your continuation starting from line {next_line}:
             
             # Parse the JSON
             try:
-                data = json.loads(json_content)
+                data = json_utils.loads(json_content)
             except json.JSONDecodeError:
                 # Try again with a more aggressive approach to find JSON
                 array_match = re.search(r'\[\s*\{\s*"line"[\s\S]+?\}\s*\]', content)
@@ -299,7 +300,7 @@ Your continuation starting from line {next_line}:
                     # Add wrapping to make it valid JSON
                     array_json = '{"lines": ' + array_match.group(0) + '}'
                     try:
-                        data = json.loads(array_json)
+                        data = json_utils.loads(array_json)
                     except json.JSONDecodeError:
                         # Individual line objects
                         line_objects = self._extract_line_objects(content) 
@@ -2,19 +2,24 @@
 Primary coder agent implementation using semantic extraction.
 Path: c4h_agents/agents/coder.py
 """
-from typing import Dict, Any
+from typing import Dict, Any, List
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
+import os
+from concurrent.futures import ThreadPoolExecutor
 
 from c4h_agents.agents.base_agent import BaseAgent, AgentResponse 
 from c4h_agents.skills.semantic_merge import SemanticMerge
 from c4h_agents.skills.semantic_iterator import SemanticIterator
-from c4h_agents.skills.asset_manager import AssetManager
+from c4h_agents.skills.asset_manager import AssetManager, AssetResult
 from c4h_agents.utils.logging import get_logger
 
 logger = get_logger()
 
+# Keys AssetManager.process_action checks for the target file, in order
+_PATH_KEYS = ('file_path', 'path', 'file', 'filename')
+
 @dataclass 
 class CoderMetrics:
     """Detailed metrics for code processing operations"""
@@ -47,9 +52,56 @@ class Coder(BaseAgent):
             config=config
         )
         
+        # Changes to distinct files may be applied concurrently when enabled
+        self._change_concurrency = int(coder_config.get('change_concurrency', 1) or 1)
+
         # Initialize metrics
         self.operation_metrics = CoderMetrics()
-        logger.info("coder.initialized", backup_path=str(backup_path))
+        logger.info("coder.initialized",
+                   backup_path=str(backup_path),
+                   change_concurrency=self._change_concurrency)
+
+    def _change_target(self, change: Any, index: int) -> Any:
+        """Group key for a change: its fully resolved file path, or its index"""
+        if not isinstance(change, dict):
+            return index
+        file_path = next((change[key] for key in _PATH_KEYS if change.get(key)), None)
+        if file_path is None:
+            return index
+        try:
+            # Resolve as AssetManager will, then collapse '..' and symlinks so
+            # a.py, ./a.py and the absolute path share one group
+            return os.path.realpath(self.asset_manager._resolve_file_path(file_path))
+        except Exception:
+            return index
+
+    def _apply_changes(self, changes: List[Any]) -> List[AssetResult]:
+        """Apply changes in order, overlapping work on distinct files when enabled"""
+        if self._change_concurrency <= 1 or len(changes) <= 1:
+            return [self.asset_manager.process_action(change) for change in changes]
+
+        # Changes to the same file stay sequential within one group
+        groups: Dict[Any, List[int]] = {}
+        for index, change in enumerate(changes):
+            groups.setdefault(self._change_target(change, index), []).append(index)
+
+        if len(groups) <= 1:
+            return [self.asset_manager.process_action(change) for change in changes]
+
+        def apply_group(indexes: List[int]) -> List[AssetResult]:
+            return [self.asset_manager.process_action(changes[i]) for i in indexes]
+
+        logger.info("coder.concurrent_changes",
+                   changes=len(changes),
+                   files=len(groups),
+                   max_workers=min(self._change_concurrency, len(groups)))
+
+        results: List[Any] = [None] * len(changes)
+        with ThreadPoolExecutor(max_workers=min(self._change_concurrency, len(groups))) as executor:
+            for indexes, group_results in zip(groups.values(), executor.map(apply_group, groups.values())):
+                for i, result in zip(indexes, group_results):
+                    results[i] = result
+        return results
 
     def process(self, context: Dict[str, Any]) -> AgentResponse:
         """Process code changes using semantic extraction"""
@@ -75,14 +127,18 @@ class Coder(BaseAgent):
                     error=f"Iterator failed: {iterator_result.error}"
                 )
             
-            # Process each change
-            results = []
+            # Collect changes, then apply them
+            changes = []
             for change in self.iterator:
                 logger.debug("coder.processing_change", 
                             type=type(change).__name__,  # See what type we're dealing with
                             change=repr(change) )              # Original logging
-                result = self.asset_manager.process_action(change)
-                
+                changes.append(change)
+
+            results = self._apply_changes(changes)
+
+            # Metrics are updated serially once all changes are applied
+            for result in results:
                 if result.success:
                     self.operation_metrics.successful_changes += 1
                 else:
@@ -90,7 +146,6 @@ class Coder(BaseAgent):
                     self.operation_metrics.error_count += 1
                 
                 self.operation_metrics.total_changes += 1
-                results.append(result)
 
             success = bool(results) and any(r.success for r in results)
             self.operation_metrics.end_time = datetime.now(timezone.utc).isoformat()
@@ -3,9 +3,19 @@ Discovery agent implementation.
 Path: src/agents/discovery.py
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Set, Union, Iterator, Pattern
 import subprocess
 import sys
+import os
+import re
+import fnmatch
+import json
+import hashlib
+import tempfile
+import asyncio
+import importlib.util
+from types import ModuleType
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dataclasses import dataclass, field
@@ -15,16 +25,27 @@ from c4h_agents.utils.logging import get_logger
 
 logger = get_logger()
 
+# Section fences emitted by tartxt
+_MANIFEST_FENCE = "== Manifest =="
+_CONTENT_FENCE = "== Content =="
+
 @dataclass
 class DiscoveryResult:
     """Result of project discovery operation"""
     success: bool
-    files: Dict[str, bool]
-    raw_output: str
+    files: Set[str]
+    raw_output: Union[str, bytes]   # Undecoded bytes when captured from a tartxt subprocess
     project_path: str
     error: Optional[str] = None
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
 
+    @property
+    def raw_text(self) -> str:
+        """Raw tartxt output as text, decoded on first access"""
+        if isinstance(self.raw_output, bytes):
+            self.raw_output = self.raw_output.decode('utf-8', 'replace')
+        return self.raw_output
+
 class DiscoveryAgent(BaseAgent):
     """Agent responsible for project discovery using tartxt"""
     
@@ -42,6 +63,21 @@ class DiscoveryAgent(BaseAgent):
         
         # Get tartxt config
         self.tartxt_config = discovery_config.get('tartxt_config', {})
+
+        # Exclusions are normalized and compiled once per agent
+        self._exclusion_list = self._normalize_exclusions(self.tartxt_config.get('exclusions', []))
+        self._exclusion_re: Optional[Pattern[str]] = (
+            re.compile("|".join(fnmatch.translate(p) for p in self._exclusion_list))
+            if self._exclusion_list else None
+        )
+
+        # In-process tartxt module, loaded on first use
+        self._tartxt: Optional[ModuleType] = None
+        self._tartxt_path: Optional[Path] = None
+
+        # Latest (fingerprint key, result) per (base path, input paths); a
+        # changed tree replaces its entry rather than adding a snapshot
+        self._cache: Dict[Tuple[str, Tuple[str, ...]], Tuple[str, DiscoveryResult]] = {}
         
         logger.info("discovery.initialized",
                    workspace_root=str(self.workspace_root),
@@ -51,49 +87,300 @@ class DiscoveryAgent(BaseAgent):
         """Get agent name for config lookup."""
         return "discovery"
 
-    def _parse_manifest(self, output: str) -> Dict[str, bool]:
-        """Parse manifest section from tartxt output to get file list"""
-        files = {}
-        manifest_section = False
-        
-        for line in output.split('\n'):
-            line = line.strip()
-            
-            if line == "== Manifest ==":
-                manifest_section = True
-                continue
-            elif line.startswith("== Content =="):
-                break
-                
-            if manifest_section and line:
-                if not line.startswith('=='):
-                    norm_path = line.replace('\\', '/')
-                    files[norm_path] = True
-                    
-        return files
+    def _normalize_exclusions(self, exclusions: Any) -> List[str]:
+        """Normalize configured exclusions to a list of glob patterns"""
+        if isinstance(exclusions, str):
+            return [x.strip() for x in exclusions.split(',') if x.strip()]
+        if isinstance(exclusions, (list, tuple)):
+            return [str(x).strip() for x in exclusions if x]
+        logger.warning("discovery.invalid_exclusions",
+                    type=type(exclusions).__name__,
+                    using="default empty list")
+        return []
+
+    def _parse_manifest_line(self, state: str, line: str, files: Set[str]) -> str:
+        """Advance manifest parser state by one line, recording manifest entries"""
+        if state == "content":
+            return state
 
-    def _resolve_input_paths(self, project_path: Path) -> List[str]:
-        """Resolve input paths against project root"""
+        line = line.strip()
+        if line == _MANIFEST_FENCE:
+            return "manifest"
+        if line.startswith(_CONTENT_FENCE):
+            return "content"
+
+        if state == "manifest" and line and not line.startswith('=='):
+            files.add(sys.intern(line.replace('\\', '/')))
+
+        return state
+
+    def _parse_manifest(self, output: str) -> Set[str]:
+        """Parse manifest section from tartxt output to get file set"""
+        start = output.find(_MANIFEST_FENCE)
+        if start < 0:
+            return set()
+        start += len(_MANIFEST_FENCE)
+        end = output.find(_CONTENT_FENCE, start)
+        region = output[start:end] if end >= 0 else output[start:]
+
+        return {
+            sys.intern(line.replace('\\', '/'))
+            for raw_line in region.splitlines()
+            if (line := raw_line.strip()) and not line.startswith('==')
+        }
+
+    def _resolve_input_paths(self, project_path: Path, skip_resolve: bool = False) -> List[str]:
+        """Resolve input paths against project root.
+
+        With skip_resolve, relative paths are joined to the project root
+        lexically instead of through Path.resolve(), avoiding per-directory
+        stat calls. Symlinks inside the project are then left as given.
+        """
         input_paths = self.tartxt_config.get('input_paths', [])
-        resolved_paths = []
-        
-        for path in input_paths:
-            # If path is absolute, use it directly
-            if Path(path).is_absolute():
-                resolved_paths.append(str(Path(path)))
-            else:
-                # Resolve relative path against project root
-                full_path = (project_path / path).resolve()
-                resolved_paths.append(str(full_path))
+
+        if skip_resolve:
+            root = str(project_path)
+            resolved_paths = [
+                os.path.normpath(path if os.path.isabs(path) else os.path.join(root, path))
+                for path in input_paths
+            ]
+        else:
+            resolved_paths = []
+            for path in input_paths:
+                # If path is absolute, use it directly
+                if Path(path).is_absolute():
+                    resolved_paths.append(str(Path(path)))
+                else:
+                    # Resolve relative path against project root
+                    full_path = (project_path / path).resolve()
+                    resolved_paths.append(str(full_path))
                 
         logger.debug("discovery.resolved_paths",
                     project_path=str(project_path),
                     input_paths=input_paths,
-                    resolved_paths=resolved_paths)
+                    resolved_paths=resolved_paths,
+                    skip_resolve=skip_resolve)
                     
         return resolved_paths
 
-    """Update to _run_tartxt method in discovery.py"""
+    def _fingerprint_path(self, path: str) -> str:
+        """
+        Change fingerprint of every file tartxt would read under path:
+        the same walk and exclusion match, recording (path, mtime_ns, size)
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        exclusion_re = self._exclusion_re
+        if os.path.isdir(path):
+            for root, dirs, filenames in os.walk(path):
+                dirs.sort()
+                for name in sorted(filenames):
+                    file_path = os.path.join(root, name)
+                    if exclusion_re is not None and exclusion_re.match(file_path):
+                        continue
+                    try:
+                        st = os.stat(file_path)
+                    except OSError:
+                        continue
+                    digest.update(f"{file_path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode('utf-8', 'surrogateescape'))
+        else:
+            try:
+                st = os.stat(path)
+                digest.update(f"{path}\0{st.st_mtime_ns}\0{st.st_size}\n".encode('utf-8', 'surrogateescape'))
+            except OSError:
+                digest.update(b"missing")
+        return digest.hexdigest()
+
+    def _cache_key(self, base_path: Path, input_paths: List[str], exclusion_list: List[str]) -> str:
+        """Build discovery cache key from inputs and a filesystem fingerprint"""
+        key_data = {
+            "base": str(base_path),
+            "paths": input_paths,
+            "excl": exclusion_list,
+            "raw": bool(self.tartxt_config.get('keep_raw_output', True)),
+            "fp": [self._fingerprint_path(p) for p in input_paths]
+        }
+        return hashlib.blake2b(json.dumps(key_data, sort_keys=True).encode()).hexdigest()
+
+    def _build_tartxt_command(self, script_path: Path, exclusion_list: List[str],
+                              input_paths: List[str]) -> List[str]:
+        """Build tartxt command line for a set of input paths"""
+        # Start building command with python interpreter and script
+        cmd = [sys.executable, str(script_path.resolve())]
+
+        # Add exclusions as a single -x argument with comma-separated patterns
+        if exclusion_list:
+            cmd.extend(['-x', ','.join(exclusion_list)])
+
+        # Configure output
+        if self.tartxt_config.get('output_type') == "file":
+            output_file = self.tartxt_config.get('output_file', 'tartxt_output.txt')
+            cmd.extend(['-f', output_file])
+        else:
+            cmd.append('-o')  # stdout output
+
+        # Add input paths last
+        cmd.extend(input_paths)
+        return cmd
+
+    def _execute_tartxt(self, cmd: List[str], base_path: Path) -> Tuple[Set[str], bytes, Optional[str]]:
+        """Run a single tartxt command, streaming stdout through the manifest parser.
+
+        Output is read as bytes and only manifest lines are decoded; the content
+        section is kept undecoded until a caller needs it as text.
+
+        Returns:
+            Tuple of (files, raw_output, error). raw_output is empty when
+            tartxt_config.keep_raw_output is disabled.
+        """
+        keep_raw = self.tartxt_config.get('keep_raw_output', True)
+        files: Set[str] = set()
+        buf = bytearray()
+        scan = 0  # Offset of the next unparsed manifest line in buf
+        state = "pre"
+
+        # stderr goes to a temp file: reading a second pipe only after stdout
+        # hits EOF deadlocks once tartxt fills the stderr pipe buffer
+        with tempfile.TemporaryFile() as err_file, subprocess.Popen(
+            cmd,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=err_file,
+            bufsize=0,
+            cwd=str(base_path)  # Run from project root
+        ) as proc:
+            fd = proc.stdout.fileno()
+            while chunk := os.read(fd, 1 << 16):
+                if state == "content" and not keep_raw:
+                    continue  # Drain the pipe; content is not kept
+                buf.extend(chunk)
+                while state != "content":
+                    end = buf.find(b"\n", scan)
+                    if end < 0:
+                        break
+                    state = self._parse_manifest_line(
+                        state, buf[scan:end + 1].decode('utf-8', 'replace'), files)
+                    scan = end + 1
+            if state != "content" and scan < len(buf):
+                state = self._parse_manifest_line(state, buf[scan:].decode('utf-8', 'replace'), files)
+            returncode = proc.wait()
+            err_file.seek(0)
+            stderr = err_file.read().decode('utf-8', 'replace')
+
+        if returncode != 0:
+            logger.error("discovery.tartxt_execution_failed", 
+                        error=f"Command returned non-zero exit status {returncode}",
+                        stderr=stderr,
+                        returncode=returncode)
+            return set(), b"", f"tartxt failed with exit code {returncode}: {stderr}"
+
+        return files, bytes(buf) if keep_raw else b"", None
+
+    def _load_tartxt(self, script_path: Path) -> Optional[ModuleType]:
+        """Import tartxt script as a module for in-process discovery"""
+        script_path = script_path.resolve()
+        if self._tartxt is not None and self._tartxt_path == script_path:
+            return self._tartxt
+
+        try:
+            spec = importlib.util.spec_from_file_location("tartxt", script_path)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception as e:
+            logger.warning("discovery.tartxt_import_failed",
+                          error=str(e),
+                          script_path=str(script_path),
+                          using="subprocess")
+            return None
+
+        self._tartxt = module
+        self._tartxt_path = script_path
+        return module
+
+    def _walk(self, root: str, exclusion_re: Optional[Pattern[str]]) -> Iterator[str]:
+        """Yield non-excluded files under root in os.walk order using os.scandir"""
+        stack = [root]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            subdirs = []
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir()
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    # Like os.walk, symlinked directories are listed but not followed
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif exclusion_re is None or not exclusion_re.match(entry.path):
+                    yield entry.path
+
+            stack.extend(reversed(subdirs))
+
+    def _process_files_in_process(self, tartxt: ModuleType, exclusion_re: Optional[Pattern[str]],
+                                  input_paths: List[str]) -> str:
+        """Build tartxt output by walking inputs here and reading files with tartxt.process_file"""
+        manifest = [_MANIFEST_FENCE + "\n"]
+        content = ["\n" + _CONTENT_FENCE + "\n"]
+
+        for item in input_paths:
+            if os.path.isdir(item):
+                for file_path in self._walk(item, exclusion_re):
+                    manifest.append(file_path + "\n")
+                    content.append(tartxt.process_file(file_path, False))
+            elif os.path.isfile(item):
+                if exclusion_re is None or not exclusion_re.match(item):
+                    manifest.append(item + "\n")
+                    content.append(tartxt.process_file(item, False))
+            else:
+                manifest.append(f"Warning: {item} does not exist, skipping.\n")
+
+        return "".join(manifest) + "".join(content)
+
+    def _execute_tartxt_in_process(self, tartxt: ModuleType, exclusion_list: List[str],
+                                   input_paths: List[str]) -> Tuple[Set[str], str, Optional[str]]:
+        """Run tartxt file processing directly in this interpreter"""
+        try:
+            if hasattr(tartxt, "process_file"):
+                output = self._process_files_in_process(tartxt, self._exclusion_re, input_paths)
+            else:
+                output = tartxt.process_files(input_paths, exclusion_list, False)
+            # tartxt -o prints the result, so the subprocess output ends with a newline
+            output += "\n"
+        except Exception as e:
+            logger.error("discovery.tartxt_execution_failed",
+                        error=str(e),
+                        error_type=type(e).__name__)
+            return set(), "", f"tartxt failed: {str(e)}"
+
+        files = self._parse_manifest(output)
+        if not self.tartxt_config.get('keep_raw_output', True):
+            output = ""
+        return files, output, None
+
+    def _merge_outputs(self, outputs: List[Union[str, bytes]]) -> Union[str, bytes]:
+        """Merge sharded tartxt outputs into a single manifest and content section"""
+        if len(outputs) == 1:
+            return outputs[0]
+        if not any(outputs):
+            return ""
+
+        outputs = [o.decode('utf-8', 'replace') if isinstance(o, bytes) else o for o in outputs]
+
+        manifests = []
+        contents = []
+        for output in outputs:
+            manifest, _, content = output.partition(_CONTENT_FENCE)
+            manifests.append(manifest.replace(_MANIFEST_FENCE + "\n", "", 1).strip('\n'))
+            contents.append(content.strip('\n'))
+
+        return (_MANIFEST_FENCE + "\n" + "\n".join(m for m in manifests if m) +
+                "\n\n" + _CONTENT_FENCE + "\n" + "\n".join(c for c in contents if c) + "\n")
 
     def _run_tartxt(self, project_path: str) -> DiscoveryResult:
         """Run tartxt discovery tool to analyze project files.
@@ -108,13 +395,23 @@ class DiscoveryAgent(BaseAgent):
         - Input path resolution against project root  
         - Exclusion pattern handling
         - Output format selection
+        - Optional sharding of input paths across parallel tartxt runs
+          (tartxt_config.parallel_discovery)
+        - Result caching keyed by inputs and an mtime fingerprint
+          (tartxt_config.cache_discovery)
+        - In-process tartxt execution for stdout output, with the subprocess
+          path kept as fallback (tartxt_config.in_process)
         """
         try:
             # Convert to Path and resolve
             base_path = Path(project_path).resolve()
             
-            # Get resolved input paths
-            input_paths = self._resolve_input_paths(base_path)
+            # Get input paths - base_path is already resolved, so a lexical
+            # join is enough unless symlinks must be followed
+            input_paths = self._resolve_input_paths(
+                base_path,
+                skip_resolve=not self.tartxt_config.get('resolve_input_paths', False)
+            )
             if not input_paths:
                 raise ValueError("No input paths configured or resolved")
             
@@ -127,78 +424,100 @@ class DiscoveryAgent(BaseAgent):
             if not script_path.is_file():
                 raise ValueError(f"tartxt script not found at: {script_path}")
 
-            # Start building command with python interpreter and script
-            cmd = [sys.executable, str(script_path.resolve())]
-                
-            # Process exclusions - normalize to list
-            exclusions = self.tartxt_config.get('exclusions', [])
-            if isinstance(exclusions, str):
-                exclusion_list = [x.strip() for x in exclusions.split(',') if x.strip()]
-            elif isinstance(exclusions, (list, tuple)):
-                exclusion_list = [str(x).strip() for x in exclusions if x]
-            else:
-                logger.warning("discovery.invalid_exclusions",
-                            type=type(exclusions).__name__,
-                            using="default empty list")
-                exclusion_list = []
-
-            # Add exclusions as a single -x argument with comma-separated patterns
+            # Exclusions were normalized at init
+            exclusion_list = self._exclusion_list
             if exclusion_list:
-                cmd.extend(['-x', ','.join(exclusion_list)])
                 logger.debug("discovery.tartxt_command.exclusions",
                             patterns=exclusion_list)
 
-            # Configure output
-            if self.tartxt_config.get('output_type') == "file":
-                output_file = self.tartxt_config.get('output_file', 'tartxt_output.txt')
-                cmd.extend(['-f', output_file])
+            # Serve unchanged trees from cache
+            cache_key = None
+            cache_slot = (str(base_path), tuple(input_paths))
+            if self.tartxt_config.get('cache_discovery', True):
+                cache_key = self._cache_key(base_path, input_paths, exclusion_list)
+                cached = self._cache.get(cache_slot)
+                if cached is not None and cached[0] == cache_key:
+                    logger.info("discovery.cache_hit",
+                            file_count=len(cached[1].files),
+                            project_path=str(base_path))
+                    return cached[1]
+
+            # Shard input paths across parallel tartxt runs (stdout output only)
+            parallel = int(self.tartxt_config.get('parallel_discovery', 1) or 1)
+            shard_count = min(parallel, len(input_paths))
+            if shard_count > 1 and self.tartxt_config.get('output_type') != "file":
+                shards = [input_paths[i::shard_count] for i in range(shard_count)]
             else:
-                cmd.append('-o')  # stdout output
+                shards = [input_paths]
 
-            # Add input paths last
-            cmd.extend(input_paths)
+            # Prefer in-process tartxt for stdout output, falling back to subprocess
+            tartxt = None
+            if (self.tartxt_config.get('in_process', True) and
+                    self.tartxt_config.get('output_type') != "file"):
+                tartxt = self._load_tartxt(script_path)
 
-            # Log complete command
-            logger.debug("discovery.tartxt_command",
-                        cmd=cmd,
-                        input_paths=input_paths,
-                        project_path=str(base_path),
-                        script_path=str(script_path))
+            if tartxt is not None:
+                logger.debug("discovery.tartxt_in_process",
+                            shards=len(shards),
+                            input_paths=input_paths,
+                            project_path=str(base_path),
+                            script_path=str(script_path))
 
-            # Run tartxt with output capture
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=str(base_path)  # Run from project root
-                )
-            except subprocess.CalledProcessError as e:
-                logger.error("discovery.tartxt_execution_failed", 
-                            error=str(e),
-                            stderr=e.stderr,
-                            returncode=e.returncode)
+                def run_shard(index: int):
+                    return self._execute_tartxt_in_process(tartxt, exclusion_list, shards[index])
+            else:
+                commands = [
+                    self._build_tartxt_command(script_path, exclusion_list, shard)
+                    for shard in shards
+                ]
+
+                # Log complete command set
+                logger.debug("discovery.tartxt_command",
+                            cmd=commands[0] if len(commands) == 1 else commands,
+                            shards=len(commands),
+                            input_paths=input_paths,
+                            project_path=str(base_path),
+                            script_path=str(script_path))
+
+                def run_shard(index: int):
+                    return self._execute_tartxt(commands[index], base_path)
+
+            # Run tartxt with output capture, one run per shard
+            if len(shards) == 1:
+                results = [run_shard(0)]
+            else:
+                with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                    results = list(executor.map(run_shard, range(len(shards))))
+
+            errors = [error for _, _, error in results if error]
+            if errors:
                 return DiscoveryResult(
                     success=False,
-                    files={},
-                    raw_output=e.stderr,
+                    files=set(),
+                    raw_output="\n".join(errors),
                     project_path=str(base_path),
-                    error=f"tartxt failed with exit code {e.returncode}: {e.stderr}"
+                    error="; ".join(errors)
                 )
 
-            # Parse output and return result
-            files = self._parse_manifest(result.stdout)
+            # Manifests were parsed while streaming; merge shard results
+            files: Set[str] = set()
+            for shard_files, _, _ in results:
+                files.update(shard_files)
+            output = self._merge_outputs([raw for _, raw, _ in results])
+
             logger.info("discovery.complete",
                     file_count=len(files),
                     project_path=str(base_path))
 
-            return DiscoveryResult(
+            result = DiscoveryResult(
                 success=True,
                 files=files,
-                raw_output=result.stdout,
+                raw_output=output,
                 project_path=str(base_path)
             )
+            if cache_key is not None:
+                self._cache[cache_slot] = (cache_key, result)
+            return result
 
         except ValueError as e:
             # Configuration/validation errors
@@ -207,7 +526,7 @@ class DiscoveryAgent(BaseAgent):
                         project_path=project_path)
             return DiscoveryResult(
                 success=False,
-                files={},
+                files=set(),
                 raw_output="",
                 project_path=str(project_path),
                 error=str(e)
@@ -221,13 +540,22 @@ class DiscoveryAgent(BaseAgent):
                         project_path=project_path)
             return DiscoveryResult(
                 success=False,
-                files={},
+                files=set(),
                 raw_output="",
                 project_path=str(project_path),
                 error=f"Unexpected error: {str(e)}"
             )
 
 
+    async def _run_tartxt_async(self, project_path: str) -> DiscoveryResult:
+        """Run tartxt discovery without blocking the event loop.
+
+        Discovery runs in a worker thread so both the in-process and the
+        subprocess tartxt paths, and the shared cache, behave exactly as in
+        _run_tartxt while callers overlap it with other awaitables.
+        """
+        return await asyncio.to_thread(self._run_tartxt, project_path)
+
     def process(self, context: Dict[str, Any]) -> AgentResponse:
         """Process a project discovery request."""
         try:
@@ -250,12 +578,18 @@ class DiscoveryAgent(BaseAgent):
 
             # Run discovery
             result = self._run_tartxt(str(project_path))
+
+            # Emit a JSON-friendly file list; dict form kept for legacy consumers
+            if self.tartxt_config.get('files_as_dict', False):
+                files = {path: True for path in sorted(result.files)}
+            else:
+                files = sorted(result.files)
             
             return AgentResponse(
                 success=result.success,
                 data={
-                    "files": result.files,
-                    "raw_output": result.raw_output,
+                    "files": files,
+                    "raw_output": result.raw_text,
                     "project_path": result.project_path,
                     "timestamp": result.timestamp
                 },
@@ -3,13 +3,56 @@ Lineage context management for agent coordination.
 Path: c4h_agents/agents/lineage_context.py
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import uuid
-from copy import deepcopy
+import time
 from datetime import datetime, timezone
 import json
 from c4h_agents.utils.logging import get_logger
 logger = get_logger()
+
+# Keys reported by extract_lineage_info, and those that may fall back to lineage_metadata
+_LINEAGE_KEYS = ("agent_execution_id", "parent_id", "workflow_run_id", "execution_path",
+                 "step", "agent_type", "skill_type")
+_METADATA_KEYS = ("workflow_run_id", "execution_path", "step")
+_UTC = timezone.utc
+
+# Key layout of freshly created lineage_metadata, cloned rather than rebuilt
+_META_PROTO = {"workflow_run_id": None, "timestamp": None, "execution_path": None}
+
+# Last ISO timestamp and the monotonic time it was produced at
+_TS_CACHE: Tuple[int, str] = (0, "")
+
+def _iso_now() -> str:
+    """Current UTC time in ISO format, reused for calls within the same millisecond"""
+    global _TS_CACHE
+    now = time.monotonic_ns()
+    if now - _TS_CACHE[0] < 1_000_000:
+        return _TS_CACHE[1]
+    stamp = datetime.now(_UTC).isoformat()
+    _TS_CACHE = (now, stamp)
+    return stamp
+
+def _ensure_scaffold(context: Dict[str, Any], workflow_run_id: Optional[str],
+                     entry: Optional[str] = None, system: bool = True) -> Dict[str, Any]:
+    """Copy-on-write the system namespace and lineage metadata, appending entry to the execution path"""
+    if system:
+        # Add to system namespace for compatibility (copied before write)
+        context["system"] = {**context.get("system", {}), "runid": workflow_run_id}
+
+    metadata = context.get("lineage_metadata")
+    if metadata is None:
+        metadata = _META_PROTO.copy()
+        metadata["workflow_run_id"] = workflow_run_id
+        metadata["timestamp"] = _iso_now()
+        metadata["execution_path"] = [entry] if entry else []
+    elif entry:
+        # Copy metadata and path so the base context is never mutated
+        metadata = {**metadata, "execution_path": list(metadata.get("execution_path", ()))}
+        metadata["execution_path"].append(entry)
+    context["lineage_metadata"] = metadata
+    return metadata
+
 class LineageContext:
     """
     Utility class for managing execution context with lineage tracking.
@@ -28,22 +71,14 @@ class LineageContext:
         Returns:
             Context dictionary with workflow tracking IDs
         """
-        context = deepcopy(base_context) if base_context else {}
+        context = {**base_context} if base_context else {}
         
         # Set workflow run ID as the overarching execution ID
         context["workflow_run_id"] = workflow_run_id
         
-        # Add to system namespace for compatibility
-        if "system" not in context:
-            context["system"] = {}
-        context["system"]["runid"] = workflow_run_id
-        
-        # Add tracking metadata
-        context["lineage_metadata"] = {
-            "workflow_run_id": workflow_run_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
-            "execution_path": []
-        }
+        # Add system namespace and fresh tracking metadata
+        context.pop("lineage_metadata", None)
+        _ensure_scaffold(context, workflow_run_id)
         
         return context
     
@@ -63,10 +98,11 @@ class LineageContext:
         Returns:
             Context dictionary with agent tracking IDs
         """
-        context = deepcopy(base_context) if base_context else {}
+        context = {**base_context} if base_context else {}
         
         # Generate unique execution ID for this agent
-        agent_execution_id = str(uuid.uuid4())
+        execution_uuid = uuid.uuid4()
+        agent_execution_id = str(execution_uuid)
         
         # Set workflow and agent IDs
         context["workflow_run_id"] = workflow_run_id
@@ -81,29 +117,8 @@ class LineageContext:
         if step is not None:
             context["step"] = step
         
-        # Get or create lineage metadata
-        if "lineage_metadata" not in context:
-            context["lineage_metadata"] = {
-                "workflow_run_id": workflow_run_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "execution_path": []
-            }
-        
-        # Update execution path
-        if "execution_path" in context["lineage_metadata"]:
-            # Copy to avoid mutating the original
-            path = list(context["lineage_metadata"]["execution_path"])
-        else:
-            path = []
-            
-        # Add this agent to the path
-        path.append(f"{agent_type}:{agent_execution_id[:8]}")
-        context["lineage_metadata"]["execution_path"] = path
-        
-        # Add to system namespace for compatibility
-        if "system" not in context:
-            context["system"] = {}
-        context["system"]["runid"] = workflow_run_id
+        # Get or create lineage metadata, adding this agent to the execution path
+        _ensure_scaffold(context, workflow_run_id, f"{agent_type}:{execution_uuid.hex[:8]}")
         context["system"]["agent_id"] = agent_execution_id
         
         return context
@@ -123,10 +138,11 @@ class LineageContext:
         Returns:
             Context dictionary with skill tracking IDs
         """
-        context = deepcopy(base_context) if base_context else {}
+        context = {**base_context} if base_context else {}
         
         # Generate unique execution ID for this skill
-        skill_execution_id = str(uuid.uuid4())
+        execution_uuid = uuid.uuid4()
+        skill_execution_id = str(execution_uuid)
         
         # Extract workflow run ID from base context if not provided
         if not workflow_run_id and base_context:
@@ -144,30 +160,10 @@ class LineageContext:
         # Preserve workflow run ID
         if workflow_run_id:
             context["workflow_run_id"] = workflow_run_id
-            
-            # Add to system namespace for compatibility
-            if "system" not in context:
-                context["system"] = {}
-            context["system"]["runid"] = workflow_run_id
-        
-        # Get or create lineage metadata
-        if "lineage_metadata" not in context:
-            context["lineage_metadata"] = {
-                "workflow_run_id": workflow_run_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "execution_path": []
-            }
-            
-        # Update execution path
-        if "execution_path" in context["lineage_metadata"]:
-            # Copy to avoid mutating the original
-            path = list(context["lineage_metadata"]["execution_path"])
-        else:
-            path = []
-            
-        # Add this skill to the path
-        path.append(f"{skill_type}:{skill_execution_id[:8]}")
-        context["lineage_metadata"]["execution_path"] = path
+        
+        # Get or create lineage metadata, adding this skill to the execution path
+        _ensure_scaffold(context, workflow_run_id, f"{skill_type}:{execution_uuid.hex[:8]}",
+                         system=bool(workflow_run_id))
         
         return context
     
@@ -182,35 +178,24 @@ class LineageContext:
         Returns:
             Dictionary with extracted lineage information
         """
-        # Default empty values
-        lineage_info = {
-            "agent_execution_id": None,
-            "parent_id": None, 
-            "workflow_run_id": None,
-            "execution_path": [],
-            "step": None,
-            "agent_type": None,
-            "skill_type": None
-        }
-        
-        # Extract direct keys
-        for key in lineage_info.keys():
-            if key in context:
-                lineage_info[key] = context[key]
+        # Extract direct keys in a single pass
+        lineage_info = {key: context.get(key) for key in _LINEAGE_KEYS}
+        if "execution_path" not in context:
+            lineage_info["execution_path"] = []
         
         # Extract from lineage_metadata if available
-        if "lineage_metadata" in context:
-            metadata = context["lineage_metadata"]
-            for key in ["workflow_run_id", "execution_path", "step"]:
-                if key in metadata and lineage_info[key] is None:
-                    lineage_info[key] = metadata[key]
+        metadata = context.get("lineage_metadata") or {}
+        if metadata:
+            for key in _METADATA_KEYS:
+                if lineage_info[key] is None:
+                    lineage_info[key] = metadata.get(key)
         
         # Extract from system namespace as fallback
-        if "system" in context:
-            system = context["system"]
-            if lineage_info["workflow_run_id"] is None and "runid" in system:
-                lineage_info["workflow_run_id"] = system["runid"]
-            if lineage_info["agent_execution_id"] is None and "agent_id" in system:
-                lineage_info["agent_execution_id"] = system["agent_id"]
-        
-        return lineage_info
\ No newline at end of file
+        system = context.get("system") or {}
+        if system:
+            if lineage_info["workflow_run_id"] is None:
+                lineage_info["workflow_run_id"] = system.get("runid")
+            if lineage_info["agent_execution_id"] is None:
+                lineage_info["agent_execution_id"] = system.get("agent_id")
+        
+        return lineage_info
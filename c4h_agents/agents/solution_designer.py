@@ -3,67 +3,156 @@ Solution designer implementation focused on synchronous operation.
 Path: src/agents/solution_designer.py
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple, List, NamedTuple
+from dataclasses import dataclass
 from datetime import datetime
-import json
+import string
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from c4h_agents.agents.base_agent import BaseAgent, LogDetail, AgentResponse 
 from config import locate_config
 from c4h_agents.utils.logging import get_logger
 
 logger = get_logger()
 
+# Placeholders supported by the solution prompt template
+_TEMPLATE_FIELDS = ("source_code", "intent")
+
+# Rendered requests kept for repeated (discovery output, intent) pairs
+_REQUEST_CACHE_SIZE = 64
+
+@dataclass(slots=True)
+class _DesignView:
+    """Solution design inputs extracted once from a nested or flat context"""
+    raw_output: str
+    intent_desc: str
+    iteration: int
+
+class DesignContext(NamedTuple):
+    """Template inputs for a solution design request"""
+    source_code: str
+    intent: str
+    iteration: int
+
 class SolutionDesigner(BaseAgent):
     """Designs specific code modifications based on intent and discovery analysis."""
     
     def __init__(self, config: Dict[str, Any] = None):
         """Initialize designer with configuration."""
         super().__init__(config=config)
-        logger.info("solution_designer.initialized")
+        # Debug logging guard, resolved once from logging.agent_level
+        self._debug_enabled = self._should_log(LogDetail.DEBUG)
+
+        # Design view of the process() call running on each thread
+        self._call_state = threading.local()
+
+        # Cache and pre-parse solution template unless disabled for live prompt edits
+        self._solution_template: Optional[str] = None
+        self._solution_parts: Optional[List[Tuple[str, Optional[str]]]] = None
+        if self.config_node.get_value("llm_config.agents.solution_designer.cache_template") is not False:
+            try:
+                self._solution_template = self._get_prompt('solution')
+            except ValueError as e:
+                logger.debug("solution_designer.template_not_cached", error=str(e))
+            else:
+                self._solution_parts = self._parse_template(self._solution_template)
+
+        # Rendered requests keyed by a digest of their inputs; only used with a
+        # cached template, since a live template may change between calls
+        self._request_cache: Optional[Dict[bytes, str]] = None
+        self._request_cache_lock = threading.Lock()
+        if (self._solution_template is not None and
+                self.config_node.get_value("llm_config.agents.solution_designer.cache_requests") is not False):
+            self._request_cache = {}
+
+        logger.info("solution_designer.initialized",
+                    template_cached=self._solution_parts is not None,
+                    request_cache=self._request_cache is not None)
 
     def _get_agent_name(self) -> str:
         """Get agent name for config lookup"""
         return "solution_designer"
 
 
+    def _parse_template(self, template: str) -> Optional[List[Tuple[str, Optional[str]]]]:
+        """Split solution template into (literal, field) pairs for fast rendering"""
+        try:
+            parts = []
+            for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+                # Only plain {source_code}/{intent} fields can be rendered by joining
+                if field_name is not None and (field_name not in _TEMPLATE_FIELDS or format_spec or conversion):
+                    return None
+                parts.append((literal, field_name))
+            return parts
+        except ValueError as e:
+            logger.debug("solution_designer.template_not_cached", error=str(e))
+            return None
+
+    def _render_solution(self, raw_output: str, intent_desc: str) -> str:
+        """Render solution request from cached template parts or the live prompt"""
+        if self._solution_parts is None:
+            template = self._solution_template or self._get_prompt('solution')
+            return template.format(
+                source_code=raw_output,
+                intent=intent_desc
+            )
+
+        values = {"source_code": raw_output, "intent": intent_desc}
+        return "".join(
+            literal if field_name is None else literal + values[field_name]
+            for literal, field_name in self._solution_parts
+        )
+
+    def _cached_request(self, raw_output: str, intent_desc: str) -> str:
+        """Render the solution request, serving repeated inputs from the digest cache"""
+        cache = self._request_cache
+        if cache is None:
+            return self._render_solution(raw_output, intent_desc)
+
+        key = (hashlib.blake2b(str(raw_output).encode('utf-8', 'surrogatepass'), digest_size=16).digest() +
+               hashlib.blake2b(str(intent_desc).encode('utf-8', 'surrogatepass'), digest_size=16).digest())
+        with self._request_cache_lock:
+            request = cache.get(key)
+        if request is not None:
+            if self._debug_enabled:
+                logger.debug("solution_designer.request_cache_hit")
+            return request
+
+        request = self._render_solution(raw_output, intent_desc)
+        with self._request_cache_lock:
+            if len(cache) >= _REQUEST_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = request
+        return request
+
     def _format_request(self, context: Dict[str, Any]) -> str:
         """Format solution design request"""
         try:
-            # Get discovery data
-            discovery_data = context.get('discovery_data', {})
-            raw_output = discovery_data.get('raw_output', '')
-            
-            # Get intent from context or config
-            intent = context.get('intent', {})
-            if isinstance(intent, dict):
-                intent_desc = intent.get('description', '')
-            else:
-                intent_desc = str(intent)
+            # Get discovery data and intent
+            view = self._view(context)
+            raw_output = view.raw_output
+            intent_desc = view.intent_desc
 
-            # Log request components
-            if self._should_log(LogDetail.DEBUG):
+            # Log request components (previews only built when debugging)
+            if self._debug_enabled:
+                raw_len = len(raw_output)
+                intent_len = len(intent_desc)
                 logger.debug("solution_designer.format_request",
                             has_discovery=bool(raw_output),
-                            discovery_length=len(raw_output),
-                            intent_length=len(intent_desc),
-                            iteration=context.get('iteration', 0))
+                            discovery_length=raw_len,
+                            intent_length=intent_len,
+                            iteration=view.iteration)
                     
                 logger.debug("solution_designer.request_preview",
-                            intent_preview=intent_desc[:100] + "..." if len(intent_desc) > 100 else intent_desc,
-                            discovery_preview=raw_output[:100] + "..." if len(raw_output) > 100 else raw_output)
-
-            # Get solution template
-            solution_template = self._get_prompt('solution')
-            if self._should_log(LogDetail.DEBUG):
-                logger.debug("solution_designer.template_loaded",
-                            template_length=len(solution_template))
+                            intent_preview=(intent_desc[:100] + "...") if intent_len > 100 else intent_desc,
+                            discovery_preview=(raw_output[:100] + "...") if raw_len > 100 else raw_output)
 
-            # Format request
-            formatted_request = solution_template.format(
-                source_code=raw_output,
-                intent=intent_desc
-            )
+            # Format request from solution template, reusing the render for
+            # repeated calls with equal inputs
+            formatted_request = self._cached_request(raw_output, intent_desc)
 
-            if self._should_log(LogDetail.DEBUG):
+            if self._debug_enabled:
                 logger.debug("solution_designer.request_formatted",
                             request_length=len(formatted_request))
 
@@ -75,45 +164,44 @@ class SolutionDesigner(BaseAgent):
                         error_type=type(e).__name__)
             raise
 
-    def _extract_context_data(self, context: Dict[str, Any]) -> Dict[str, Any]:
+    def _view(self, context: Dict[str, Any]) -> _DesignView:
+        """Return the view extracted for the current process() call, or extract one"""
+        view = getattr(self._call_state, 'view', None)
+        if view is None:
+            view = self._build_view(context)
+        return view
+
+    def _build_view(self, context: Dict[str, Any]) -> _DesignView:
+        """Extract discovery output, intent and iteration from a nested or flat context"""
+        source = context['input_data'] if 'input_data' in context else context
+        discovery_data = source.get('discovery_data', {})
+        intent = source.get('intent', {})
+        iteration = context.get('iteration', 0)
+
+        if hasattr(discovery_data, 'raw_output'):
+            raw_output = discovery_data.raw_output
+        elif isinstance(discovery_data, dict):
+            raw_output = discovery_data.get('raw_output', '')
+        else:
+            raw_output = ''
+        get_intent = getattr(intent, 'get', None)
+        intent_desc = get_intent('description', '') if get_intent is not None else str(intent)
+
+        return _DesignView(raw_output=raw_output or '', intent_desc=intent_desc, iteration=iteration)
+
+    def _extract_context_data(self, context: Dict[str, Any]) -> Optional[DesignContext]:
         """Extract consistent data whether from nested or flat context"""
         try:
-            if 'input_data' in context:
-                input_data = context['input_data']
-                discovery_data = input_data.get('discovery_data', {})
-                raw_output = discovery_data.get('raw_output', '')
-                intent = input_data.get('intent', {})
-                intent_desc = intent.get('description', '') if isinstance(intent, dict) else str(intent)
-            else:
-                discovery_data = context.get('discovery_data', {})
-                raw_output = discovery_data.get('raw_output', '')
-                intent = context.get('intent', {})
-                intent_desc = intent.get('description', '') if isinstance(intent, dict) else str(intent)
-
-            return {
-                'source_code': raw_output,
-                'intent': intent_desc,
-                'iteration': context.get('iteration', 0)
-            }
+            view = self._view(context)
+            return DesignContext(view.raw_output, view.intent_desc, view.iteration)
 
         except Exception as e:
             logger.error("solution_designer.context_extraction_failed", error=str(e))
-            return {}
+            return None
 
     def _validate_input(self, context: Dict[str, Any]) -> bool:
         """Validate required input data is present"""
-        discovery_data = None
-        raw_output = None
-            
-        if 'input_data' in context:
-            discovery_data = context['input_data'].get('discovery_data', {})
-        elif 'discovery_data' in context:
-            discovery_data = context['discovery_data']
-
-        if hasattr(discovery_data, 'raw_output'):
-            raw_output = discovery_data.raw_output
-        elif isinstance(discovery_data, dict):
-            raw_output = discovery_data.get('raw_output')
+        raw_output = self._view(context).raw_output
 
         logger.info("solution_designer.validate_input", 
                 has_discovery=bool(raw_output),
@@ -125,12 +213,18 @@ class SolutionDesigner(BaseAgent):
         """Process solution design request"""
         try:
             logger.info("agent.processing", context_keys=list(context.keys()))
-            
-            # Let BaseAgent handle the LLM interaction
-            response = super().process(context)
+
+            # Extract inputs once per call. The view is held per thread, not in
+            # the context, which is recorded in lineage and logged
+            self._call_state.view = self._build_view(context)
+            try:
+                # Let BaseAgent handle the LLM interaction
+                response = super().process(context)
+            finally:
+                self._call_state.view = None
             
             # Log raw response for debugging
-            if self._should_log(LogDetail.DEBUG):
+            if self._debug_enabled:
                 logger.debug("solution_designer.llm_response",
                             raw_response=response.data.get("raw_output"),
                             response_content=response.data.get("response"))
@@ -142,6 +236,20 @@ class SolutionDesigner(BaseAgent):
             logger.error("solution_designer.process_failed", error=str(e))
             return AgentResponse(success=False, data={}, error=str(e))
 
+    def process_batch(self, contexts: List[Dict[str, Any]]) -> List[AgentResponse]:
+        """Process several design requests with overlapping LLM calls, preserving order"""
+        if len(contexts) <= 1:
+            return [self.process(context) for context in contexts]
+
+        # Concurrency bounded by config so provider rate limits still apply
+        max_workers = self.config_node.get_value("llm_config.agents.solution_designer.batch_concurrency") or 4
+        logger.info("solution_designer.batch_started",
+                    batch_size=len(contexts),
+                    max_workers=max_workers)
+
+        with ThreadPoolExecutor(max_workers=min(int(max_workers), len(contexts))) as executor:
+            return list(executor.map(self.process, contexts))
+
     def _process_llm_response(self, content: str, raw_response: Any) -> Dict[str, Any]:
         """Process LLM response into standard format"""
         try:
@@ -177,11 +285,13 @@ class SolutionDesigner(BaseAgent):
                 else:
                     input_data = context
 
-                # Always log what we found
-                logger.debug("solution_designer.data_extraction",
-                            has_discovery='discovery_data' in input_data,
-                            has_intent='intent' in input_data,
-                            context_keys=list(context.keys()))
+                # Log what we found; the view extracted here is reused by _format_request
+                view = self._view(context)
+                if self._debug_enabled:
+                    logger.debug("solution_designer.data_extraction",
+                                has_discovery=bool(view.raw_output),
+                                has_intent=bool(view.intent_desc),
+                                context_keys=list(context.keys()))
                     
                 return input_data
                 
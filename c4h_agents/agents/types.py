@@ -6,7 +6,8 @@ Path: c4h_agents/agents/types.py
 from typing import Dict, Any, Optional, List, Literal, Union
 from enum import Enum
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
+import time
 from pathlib import Path
 
 class LogDetail(str, Enum):
@@ -24,6 +25,13 @@ class LogDetail(str, Enum):
         except ValueError:
             return cls.BASIC
 
+    @property
+    def rank(self) -> int:
+        """Verbosity rank for range comparisons, MINIMAL=0 through DEBUG=3"""
+        return _LOG_DETAIL_RANKS[self]
+
+_LOG_DETAIL_RANKS = {level: rank for rank, level in enumerate(LogDetail)}
+
 class LLMProvider(str, Enum):
     """Supported model providers"""
     ANTHROPIC = "anthropic"
@@ -38,7 +46,7 @@ class LLMProvider(str, Enum):
         """Safe serialization for metrics and logging"""
         return f"provider_{self.value}"
 
-@dataclass 
+@dataclass(slots=True)
 class LLMMessages:
     """Complete message set for LLM interactions"""
     system: str                       # System prompt/persona
@@ -46,6 +54,7 @@ class LLMMessages:
     formatted_request: str = ""      # Optional formatted request (only if different from user)
     raw_context: Dict[str, Any] = field(default_factory=dict)      # Original input context
     timestamp: datetime = field(default_factory=datetime.utcnow)
+    _dict: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Prevent duplicate storage of content"""
@@ -53,7 +62,9 @@ class LLMMessages:
             self.formatted_request = ""  # Clear if identical to user message
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert messages to dictionary for logging"""
+        """Convert messages to dictionary for logging, built once per instance"""
+        if self._dict is not None:
+            return self._dict
         result = {
             "system": self.system,
             "user": self.user,
@@ -62,9 +73,10 @@ class LLMMessages:
         # Only include formatted_request if it contains unique content
         if self.formatted_request and self.formatted_request != self.user:
             result["formatted_request"] = self.formatted_request
+        self._dict = result
         return result
 
-@dataclass
+@dataclass(slots=True)
 class AgentResponse:
     """Standard response format for all agent operations"""
     success: bool
@@ -80,7 +92,7 @@ Quick fix for AgentMetrics to add dict access while keeping dataclass structure.
 Path: c4h_agents/agents/types.py
 """
 
-@dataclass 
+@dataclass(slots=True)
 class AgentMetrics:
     """Standard metrics tracking for agent operations"""
     total_requests: int = 0
@@ -89,9 +101,14 @@ class AgentMetrics:
     total_duration: float = 0.0
     continuation_attempts: int = 0
     last_error: Optional[str] = None
-    start_time: str = field(default_factory=lambda: datetime.utcnow().isoformat())
+    start_time: float = field(default_factory=time.time)  # Epoch seconds, see start_time_iso
     project: Optional[str] = None
 
+    @property
+    def start_time_iso(self) -> str:
+        """Start time as a naive UTC ISO string, formatted only when serialized"""
+        return datetime.fromtimestamp(self.start_time, timezone.utc).replace(tzinfo=None).isoformat()
+
     def __getitem__(self, key: str) -> Any:
         """Support dictionary-style access to attributes"""
         return getattr(self, key)
@@ -109,11 +126,11 @@ class AgentMetrics:
             "total_duration": self.total_duration,
             "continuation_attempts": self.continuation_attempts,
             "last_error": self.last_error,
-            "start_time": self.start_time,
+            "start_time": self.start_time_iso,
             "project": self.project
         }
 
-@dataclass 
+@dataclass(slots=True)
 class ProjectPaths:
     """Standard paths used across agent operations"""
     root: Path              # Project root directory
@@ -123,7 +140,7 @@ class ProjectPaths:
     config: Path           # Configuration location
     backup: Optional[Path] = None  # Optional backup directory
 
-@dataclass
+@dataclass(slots=True)
 class AgentConfig:
     """Configuration requirements for agent instantiation"""
     provider: Literal['anthropic', 'openai', 'gemini']
@@ -3,7 +3,7 @@ Configuration handling with robust dictionary access and path resolution.
 Path: c4h_agents/config.py
 """
 import yaml
-from typing import Dict, Any, Optional, List, Tuple, Union, Iterator, Pattern
+from typing import Dict, Any, Optional, List, Tuple, Union, Iterator, Pattern, Callable
 from pathlib import Path
 import structlog
 from copy import deepcopy
@@ -11,14 +11,69 @@ import collections.abc
 import json
 import fnmatch
 import re
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import os
+import math
+
+from c4h_agents.utils import json_utils
 
 logger = structlog.get_logger()
 
+def _debug_logging_enabled() -> bool:
+    """Whether debug events from this module are wanted"""
+    # Resolved once by initialize_logging_config; see the import at the end
+    return _logging_utils.debug_enabled()
+
+# Prefer the libyaml-backed loader, falling back to the pure-Python parser
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Parsed YAML keyed by (path, mtime_ns, size), evicted oldest-first
+_CONFIG_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_CONFIG_CACHE_MAX = 128
+_config_cache_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=256)
+def _compile_part(part: str) -> Union[str, Pattern[str]]:
+    """Compile a glob path segment to a regex; '*' and literal segments stay strings"""
+    if part != '*' and '*' in part:
+        return re.compile(fnmatch.translate(part))
+    return part
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(path: str, sep: str = '.') -> Tuple[str, ...]:
+    """Split a delimited config path, cached for repeated lookups"""
+    return tuple(path.split(sep))
+
+@functools.lru_cache(maxsize=512)
+def _compile_path(path: str, sep: str = '.') -> Callable[[Any], Any]:
+    """Build a lookup function for a literal path, cached per path string"""
+    parts = _split_path(path, sep)
+
+    def lookup(data: Any) -> Any:
+        current = data
+        for key in parts:
+            if type(current) is not dict:
+                # Objects and JSON strings along the path take the general route
+                return get_by_path(data, parts)
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return None
+        return current
+
+    return lookup
+
 class ConfigNode:
     """
     Node-based configuration access with hierarchical path support.
     Provides relative path queries and wildcard matching.
     """
+    __slots__ = ('data', 'base_path', '__weakref__')
+
     def __init__(self, data: Dict[str, Any], base_path: str = ""):
         """
         Initialize config node with data and optional base path.
@@ -58,8 +113,7 @@ class ConfigNode:
             return None
             
         # Standard path access
-        path_parts = path.split('.')
-        return get_by_path(self.data, path_parts)
+        return _compile_path(path)(self.data)
 
     def get_node(self, path: str) -> 'ConfigNode':
         """
@@ -106,39 +160,36 @@ class ConfigNode:
         Yields:
             Tuples of (path, value) for each match
         """
-        path_parts = path_pattern.split('.')
-        
-        def _search_recursive(data: Dict[str, Any], current_parts: List[str], 
-                             current_path: List[str]) -> Iterator[Tuple[str, Any]]:
-            # Base case: no more parts to match
-            if not current_parts:
+        # Segments are compiled once per pattern, not per visited node
+        path_parts = [_compile_part(part) for part in path_pattern.split('.')]
+        part_count = len(path_parts)
+
+        # Explicit stack in place of recursive generators; children are pushed
+        # in reverse so matches come out in depth-first document order
+        stack: List[Tuple[Any, int, List[str]]] = [(self.data, 0, [])]
+        while stack:
+            data, index, current_path = stack.pop()
+            if index == part_count:
                 yield '.'.join(current_path), data
-                return
-                
-            current_part = current_parts[0]
-            remaining_parts = current_parts[1:]
-            
-            # Handle wildcards
+                continue
+            if not isinstance(data, dict):
+                continue
+
+            current_part = path_parts[index]
             if current_part == '*':
                 # Match any key at this level
-                if isinstance(data, dict):
-                    for key, value in data.items():
-                        yield from _search_recursive(value, remaining_parts, current_path + [key])
-            elif '*' in current_part:
+                children = [(value, index + 1, current_path + [key]) for key, value in data.items()]
+                stack.extend(reversed(children))
+            elif not isinstance(current_part, str):
                 # Pattern matching within this level
-                pattern = fnmatch.translate(current_part)
-                regex = re.compile(pattern)
-                if isinstance(data, dict):
-                    for key, value in data.items():
-                        if regex.match(key):
-                            yield from _search_recursive(value, remaining_parts, current_path + [key])
+                children = [(value, index + 1, current_path + [key])
+                            for key, value in data.items() if current_part.match(key)]
+                stack.extend(reversed(children))
             else:
                 # Exact key match
-                if isinstance(data, dict) and current_part in data:
-                    yield from _search_recursive(data[current_part], remaining_parts, 
-                                              current_path + [current_part])
-        
-        yield from _search_recursive(self.data, path_parts, [])
+                value = data.get(current_part, _MISSING)
+                if value is not _MISSING:
+                    stack.append((value, index + 1, current_path + [current_part]))
 
     def __getitem__(self, key: str) -> Any:
         """
@@ -166,41 +217,62 @@ class ConfigNode:
 
 # Original functions enhanced to work with the new approach
 
-def get_by_path(data: Dict[str, Any], path: List[str]) -> Any:
+_MISSING = object()
+
+# First characters of a document json.loads can accept
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+
+def _get_by_path_slow(current: Any, path: Union[List[str], Tuple[str, ...]]) -> Any:
+    """Continue a path lookup through attribute access and JSON-encoded strings"""
+    for key in path:
+        if isinstance(current, dict):
+            current = current.get(key, _MISSING)
+            if current is _MISSING:
+                return None
+        # Handle objects that support attribute access but aren't dictionaries
+        elif hasattr(current, key) and not isinstance(current, (str, int, float, bool)):
+            try:
+                current = getattr(current, key)
+            except (AttributeError, TypeError):
+                return None
+        elif isinstance(current, str):
+            # Only a JSON object can hold the next key
+            if not current.lstrip().startswith('{'):
+                return None
+            try:
+                parsed = json.loads(current)
+                if not isinstance(parsed, dict):
+                    return None
+                current = parsed.get(key, _MISSING)
+                if current is _MISSING:
+                    return None
+            except json.JSONDecodeError:
+                return None
+        else:
+            return None
+    return current
+
+def get_by_path(data: Dict[str, Any], path: Union[List[str], Tuple[str, ...]]) -> Any:
     """
     Access dictionary data using a path list.
     
     Args:
         data: Dictionary to traverse
-        path: List of keys forming the path
+        path: List or tuple of keys forming the path
         
     Returns:
         Value at path or None if not found
     """
     try:
+        # Fast path for plain dicts; anything else continues on the slow path
         current = data
-        for key in path:
-            if isinstance(current, dict):
-                if key not in current:
-                    return None
-                current = current[key]
-            # Handle objects that support attribute access but aren't dictionaries
-            elif hasattr(current, key) and not isinstance(current, (str, int, float, bool)):
-                try:
-                    current = getattr(current, key)
-                except (AttributeError, TypeError):
-                    return None
-            elif isinstance(current, str):
-                try:
-                    parsed = json.loads(current)
-                    if isinstance(parsed, dict) and key in parsed:
-                        current = parsed[key]
-                    else:
-                        return None
-                except json.JSONDecodeError:
+        for index, key in enumerate(path):
+            if type(current) is dict:
+                current = current.get(key, _MISSING)
+                if current is _MISSING:
                     return None
             else:
-                return None
+                return _get_by_path_slow(current, path[index:])
         return current
     except Exception as e:
         logger.error("config.path_access_failed", path=path, error=str(e))
@@ -219,21 +291,18 @@ def get_value(data: Dict[str, Any], path_str: str) -> Any:
         Value at the specified path or None if not found.
     """
     # Handle both dot and slash notation for backward compatibility
-    if '/' in path_str:
-        path_list = path_str.split('/')
-    else:
-        path_list = path_str.split('.')
-        
-    return get_by_path(data, path_list)
+    return _compile_path(path_str, '/' if '/' in path_str else '.')(data)
 
-def locate_keys(data: Dict[str, Any], target_keys: List[str], current_path: List[str] = None) -> Dict[str, Tuple[Any, List[str]]]:
+def locate_keys(data: Dict[str, Any], target_keys: List[str], current_path: List[str] = None,
+                parse_json_strings: bool = True) -> Dict[str, Tuple[Any, List[str]]]:
     """
     Locate multiple keys in dictionary using hierarchy tracking.
     
     Args:
         data: Dictionary to search
         target_keys: List of keys to find
-        current_path: Path for logging (internal use)
+        current_path: Path prefix for reported paths
+        parse_json_strings: Decode string values that hold JSON
         
     Returns:
         Dict mapping found keys to (value, path) tuples
@@ -241,32 +310,42 @@ def locate_keys(data: Dict[str, Any], target_keys: List[str], current_path: List
     try:
         results = {}
         current_path = current_path or []
-        if isinstance(data, dict):
-            for key in target_keys:
-                if key in data:
-                    value = data[key]
-                    path = current_path + [key]
-                    if isinstance(value, str):
+        remaining = list(dict.fromkeys(target_keys))
+        debug = _debug_logging_enabled()
+
+        # Iterative pre-order walk: a node's own keys are checked before its
+        # children, so the first match in document order wins
+        stack = [(data, current_path)]
+        while stack and remaining:
+            node, node_path = stack.pop()
+            if isinstance(node, dict):
+                found = False
+                for key in remaining:
+                    value = node.get(key, _MISSING)
+                    if value is _MISSING:
+                        continue
+                    found = True
+                    path = node_path + [key]
+                    if parse_json_strings and isinstance(value, str) and value.lstrip()[:1] in _JSON_START_CHARS:
                         try:
                             parsed = json.loads(value)
                             value = parsed
                         except json.JSONDecodeError:
                             pass
                     results[key] = (value, path)
-                    logger.debug("config.key_located", key=key, path=path, found_type=type(value).__name__)
-            for k, v in data.items():
-                if isinstance(v, (dict, list)):
-                    child_results = locate_keys(v, [k for k in target_keys if k not in results], current_path + [k])
-                    results.update(child_results)
-        elif isinstance(data, list):
-            for i, item in enumerate(data):
-                if isinstance(item, (dict, list)):
-                    child_results = locate_keys(item, [k for k in target_keys if k not in results], current_path + [str(i)])
-                    results.update(child_results)
-        found_keys = set(results.keys())
-        missing_keys = set(target_keys) - found_keys
-        if missing_keys:
-            logger.debug("config.keys_not_found", keys=list(missing_keys), searched_path=current_path)
+                    if debug:
+                        logger.debug("config.key_located", key=key, path=path, found_type=type(value).__name__)
+                if found:
+                    remaining = [key for key in remaining if key not in results]
+                children = [(v, node_path + [k]) for k, v in node.items() if isinstance(v, (dict, list))]
+            elif isinstance(node, list):
+                children = [(item, node_path + [str(i)]) for i, item in enumerate(node) if isinstance(item, (dict, list))]
+            else:
+                continue
+            stack.extend(reversed(children))
+
+        if remaining and debug:
+            logger.debug("config.keys_not_found", keys=remaining, searched_path=current_path)
         return results
     except Exception as e:
         logger.error("config.locate_keys_failed", target_keys=target_keys, current_path=current_path, error=str(e))
@@ -285,21 +364,35 @@ def locate_config(config: Dict[str, Any], target_name: str) -> Dict[str, Any]:
         Located config dictionary or empty dict if not found
     """
     try:
-        # Use the ConfigNode for more advanced lookup
-        config_node = ConfigNode(config)
+        # Plain agent names resolve with direct lookups; dotted or wildcard
+        # names go through ConfigNode path handling
+        simple_name = '.' not in target_name and '*' not in target_name
+        config_node = None if simple_name else ConfigNode(config)
         standard_path = f"llm_config.agents.{target_name}"
-        result = config_node.get_value(standard_path)
+        if simple_name:
+            result = get_by_path(config, ("llm_config", "agents", target_name))
+        else:
+            result = config_node.get_value(standard_path)
         
         if result is not None and isinstance(result, dict):
-            logger.debug("config.located_in_hierarchy", 
-                        target=target_name, 
-                        path=standard_path, 
-                        found_keys=list(result.keys()))
+            if _debug_logging_enabled():
+                logger.debug("config.located_in_hierarchy", 
+                            target=target_name, 
+                            path=standard_path, 
+                            found_keys=list(result.keys()))
             return result
             
-        # Try wildcard search as fallback
-        wildcard_path = f"*.agents.{target_name}"
-        matches = config_node.find_all(wildcard_path)
+        # Try wildcard search as fallback: first top-level section with agents.<name>
+        if simple_name:
+            matches = []
+            if isinstance(config, dict):
+                for section, value in config.items():
+                    agents = value.get('agents') if isinstance(value, dict) else None
+                    if isinstance(agents, dict) and target_name in agents:
+                        matches.append((f"{section}.agents.{target_name}", agents[target_name]))
+                        break
+        else:
+            matches = config_node.find_all(f"*.agents.{target_name}")
         if matches:
             result_path, result_value = matches[0]
             logger.debug("config.located_with_wildcard", 
@@ -316,7 +409,79 @@ def locate_config(config: Dict[str, Any], target_name: str) -> Dict[str, Any]:
         logger.error("config.locate_failed", target=target_name, error=str(e))
         return {}
 
-def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+# Top-level sections that are not copied into each agent config
+_SYSTEM_KEYS = frozenset({'providers', 'llm_config', 'project', 'backup', 'logging', 'system'})
+
+# Leaf types deepcopy would return unchanged
+_ATOMIC_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+def _copy_value(value: Any) -> Any:
+    """Deep-copy a merged value, passing immutable leaves straight through"""
+    return value if type(value) in _ATOMIC_TYPES else _fast_deepcopy(value)
+
+def _propagate_runtime_values(result: Dict[str, Any], override: Dict[str, Any], clone: Callable[[Any], Any]) -> None:
+    """Copy non-system override sections into each agent config that lacks them"""
+    # Set comparison on the keys view runs in C; most merges carry only system sections
+    if override.keys() <= _SYSTEM_KEYS:
+        return
+    runtime_keys = [k for k in override if k not in _SYSTEM_KEYS]
+    # Copy the spine down to the agent configs before writing; agent dicts
+    # may be YAML aliases of each other or of other sections
+    llm_config = result['llm_config'] = dict(result['llm_config'])
+    if 'agents' in llm_config:
+        llm_config['agents'] = dict(llm_config['agents'])
+    agent_configs = llm_config.get('agents', {})
+    propagated = []
+    for agent_name, agent_config in agent_configs.items():
+        missing = [key for key in runtime_keys if key not in agent_config]
+        if not missing:
+            continue
+        agent_config = agent_configs[agent_name] = dict(agent_config)
+        for key in missing:
+            agent_config[key] = clone(override[key])
+        propagated.append((agent_name, missing))
+    # One event per merge level rather than one per agent and key
+    if propagated and _debug_logging_enabled():
+        logger.debug("config.merge.runtime_values", propagated=propagated)
+
+def _merge_into(result: Dict[str, Any], override: Dict[str, Any], copy: bool) -> None:
+    """Merge override into result in place; result must be owned by the caller"""
+    clone = _copy_value if copy else (lambda value: value)
+
+    # Worklist of (destination, override) dict pairs instead of recursion.
+    # Nested pairs are pushed in reverse so levels merge in depth-first order
+    stack = [(result, override)]
+    while stack:
+        result, override = stack.pop()
+        # Propagation only writes into an llm_config already in the result
+        if 'llm_config' in result:
+            _propagate_runtime_values(result, override, clone)
+
+        nested = []
+        for key, value in override.items():
+            if value is None:
+                result.pop(key, None)
+                continue
+            if key not in result:
+                result[key] = clone(value)
+                continue
+            # Plain dicts skip the Mapping ABC check; other mappings still merge
+            if type(value) is dict or isinstance(value, collections.abc.Mapping):
+                current = result[key]
+                if isinstance(current, dict):
+                    # Copy before writing in both modes: a deepcopied base keeps
+                    # YAML anchor aliasing, so this dict may be shared elsewhere
+                    current = result[key] = dict(current)
+                    nested.append((current, value))
+                else:
+                    result[key] = deep_merge(current, value, copy)
+            elif isinstance(value, Path):
+                result[key] = str(value)
+            else:
+                result[key] = clone(value)
+        stack.extend(reversed(nested))
+
+def deep_merge(base: Dict[str, Any], override: Dict[str, Any], copy: bool = True) -> Dict[str, Any]:
     """
     Deep merge dictionaries preserving hierarchical structure.
     
@@ -331,67 +496,178 @@ def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]
     Args:
         base: Base configuration dictionary
         override: Override configuration dictionary
+        copy: Deep-copy inputs into the result. When False, only dicts along
+            merged paths are copied and untouched subtrees are shared with
+            base and override; use only for inputs the caller discards.
         
     Returns:
         Merged configuration dictionary
     """
-    result = deepcopy(base)
+    # Nothing to merge when either side is empty
+    if type(base) is dict and type(override) is dict:
+        if not override:
+            return _fast_deepcopy(base) if copy else dict(base)
+        if not base:
+            clone = _copy_value if copy else (lambda value: value)
+            return {key: clone(value) for key, value in override.items() if value is not None}
+
+    # Base is copied once here; nested levels merge into that copy in place
+    result = _fast_deepcopy(base) if copy else (dict(base) if isinstance(base, dict) else base)
     try:
-        logger.debug("config.merge.starting", base_keys=list(base.keys()), override_keys=list(override.keys()), project_settings=override.get('project', {}))
-        if 'llm_config' in result or 'llm_config' in override:
-            system_keys = {'providers', 'llm_config', 'project', 'backup', 'logging', 'system'}
-            runtime_keys = {k for k in override.keys() if k not in system_keys}
-            if runtime_keys and 'llm_config' in result:
-                agent_configs = result['llm_config'].get('agents', {})
-                for agent_name, agent_config in agent_configs.items():
-                    for key in runtime_keys:
-                        if key not in agent_config:
-                            logger.debug("config.merge.runtime_value", agent=agent_name, key=key, value=override[key])
-                            agent_config[key] = deepcopy(override[key])
-        for key, value in override.items():
-            if value is None:
-                result.pop(key, None)
-                continue
-            if key not in result:
-                result[key] = deepcopy(value)
-                continue
-            if isinstance(value, collections.abc.Mapping):
-                result[key] = deep_merge(result[key], value)
-            elif isinstance(value, Path):
-                result[key] = str(value)
-            else:
-                result[key] = deepcopy(value)
-        logger.debug("config.merge.complete", result_keys=list(result.keys()), project_path=result.get('project', {}).get('path'))
+        debug = _debug_logging_enabled()
+        if debug:
+            logger.debug("config.merge.starting", base_keys=list(base.keys()), override_keys=list(override.keys()), project_settings=override.get('project', {}))
+        _merge_into(result, override, copy)
+        if debug:
+            logger.debug("config.merge.complete", result_keys=list(result.keys()), project_path=result.get('project', {}).get('path'))
         return result
     except Exception as e:
         logger.error("config.merge.failed", error=str(e), keys_processed=list(override.keys()))
         raise
 
+_JSON_FAITHFUL_MAX_ITEMS = 1_000_000
+_INT64_LIMIT = 1 << 63
+
+def _json_faithful(value: Any) -> bool:
+    """Check that a tree survives a JSON round trip unchanged"""
+    # Exact types only: subclasses (enums, OrderedDict) would come back plain.
+    # The item budget ends the walk on self-referencing trees (YAML anchors)
+    stack = [value]
+    budget = _JSON_FAITHFUL_MAX_ITEMS
+    while stack:
+        budget -= 1
+        if budget < 0:
+            return False
+        item = stack.pop()
+        item_type = type(item)
+        if item_type is dict:
+            for key in item:
+                if type(key) is not str:
+                    return False
+            stack.extend(item.values())
+        elif item_type is list:
+            stack.extend(item)
+        elif item_type is float:
+            if not math.isfinite(item):
+                return False
+        elif item_type is int:
+            # orjson reads integers past 64 bits back as floats
+            if not -_INT64_LIMIT <= item < _INT64_LIMIT:
+                return False
+        elif not (item is None or item_type is str or item_type is bool):
+            return False
+    return True
+
+def _fast_deepcopy(value: Any) -> Any:
+    """Deep-copy a config tree, via an orjson round trip when it is plain JSON data"""
+    if json_utils.ORJSON_AVAILABLE and type(value) is dict and _json_faithful(value):
+        return json_utils.loads(json_utils.dumps(value))
+    return deepcopy(value)
+
+def _load_json_sidecar(path: Path, cache_path: Path, yaml_mtime_ns: int) -> Optional[Dict[str, Any]]:
+    """Read the JSON sidecar of a YAML config if it is at least as new as the YAML"""
+    try:
+        if cache_path.stat().st_mtime_ns < yaml_mtime_ns:
+            return None
+        return json_utils.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+def _write_json_sidecar(config: Dict[str, Any], cache_path: Path) -> None:
+    """Atomically write a JSON sidecar for a parsed YAML config"""
+    if not _json_faithful(config):
+        logger.debug("config.load.sidecar_skipped", path=os.fspath(cache_path), reason="not_json_compatible")
+        return
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    try:
+        tmp_path.write_text(json_utils.dumps(config), encoding='utf-8')
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.debug("config.load.sidecar_write_failed", path=os.fspath(cache_path), error=str(e))
+        tmp_path.unlink(missing_ok=True)
+
+def clear_config_cache() -> None:
+    """Drop all memoized load_config results"""
+    with _config_cache_lock:
+        _CONFIG_CACHE.clear()
+
 def load_config(path: Path) -> Dict[str, Any]:
     """Load configuration from YAML file with comprehensive logging"""
+    # One string form of the path for the cache key and every log event
+    path_str = os.fspath(path)
     try:
-        logger.info("config.load.starting", path=str(path))
-        if not path.exists():
-            logger.error("config.load.file_not_found", path=str(path))
+        logger.info("config.load.starting", path=path_str)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            logger.error("config.load.file_not_found", path=path_str)
             return {}
-        with open(path) as f:
-            config = yaml.safe_load(f) or {}
-        logger.info("config.load.success", path=str(path), keys=list(config.keys()), size=len(str(config)))
-        return config
+
+        # Unchanged files are served from cache; callers get their own copy
+        cache_key = (path_str, st.st_mtime_ns, st.st_size)
+        with _config_cache_lock:
+            cached = _CONFIG_CACHE.get(cache_key)
+        if cached is not None:
+            logger.info("config.load.cache_hit", path=path_str, keys=list(cached.keys()))
+            return _fast_deepcopy(cached)
+
+        # Opt-in JSON sidecar keeps cold starts off the YAML parser
+        use_sidecar = os.environ.get("C4H_CONFIG_JSON_CACHE") == "1"
+        cache_path = path.with_name(path.name + ".jsoncache")
+        config = _load_json_sidecar(path, cache_path, st.st_mtime_ns) if use_sidecar else None
+        if config is None:
+            config = yaml.load(path.read_text(encoding='utf-8'), Loader=_SafeLoader) or {}
+            if use_sidecar:
+                _write_json_sidecar(config, cache_path)
+        else:
+            logger.debug("config.load.sidecar_hit", path=os.fspath(cache_path))
+        with _config_cache_lock:
+            if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+                _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+            _CONFIG_CACHE[cache_key] = config
+        logger.info("config.load.success", path=path_str, keys=list(config.keys()), size=st.st_size)
+        return _fast_deepcopy(config)
     except yaml.YAMLError as e:
-        logger.error("config.load.yaml_error", path=str(path), error=str(e), line=getattr(e, 'line', None), column=getattr(e, 'column', None))
+        logger.error("config.load.yaml_error", path=path_str, error=str(e), line=getattr(e, 'line', None), column=getattr(e, 'column', None))
         return {}
     except Exception as e:
-        logger.error("config.load.failed", path=str(path), error=str(e), error_type=type(e).__name__)
+        logger.error("config.load.failed", path=path_str, error=str(e), error_type=type(e).__name__)
         return {}
 
+def _load_configs(paths: List[Path]) -> List[Dict[str, Any]]:
+    """Load independent config files concurrently, preserving order"""
+    if len(paths) < 2:
+        return [load_config(path) for path in paths]
+    # File reads and libyaml parsing overlap across threads
+    with ThreadPoolExecutor(max_workers=len(paths)) as executor:
+        return list(executor.map(load_config, paths))
+
+def load_all(paths: List[Path]) -> Dict[str, Any]:
+    """
+    Load several config files and merge them left to right.
+
+    Args:
+        paths: Config files, each overriding the ones before it
+
+    Returns:
+        Merged configuration dictionary
+    """
+    configs = _load_configs(list(paths))
+    if not configs:
+        return {}
+    result = configs[0]
+    for config in configs[1:]:
+        # Every loaded config is a fresh copy owned here
+        result = deep_merge(result, config, copy=False)
+    return result
+
 def load_with_app_config(system_path: Path, app_path: Path) -> Dict[str, Any]:
     """Load and merge system config with app config with full logging"""
     try:
-        logger.info("config.merge.starting", system_path=str(system_path), app_path=str(app_path))
-        system_config = load_config(system_path)
-        app_config = load_config(app_path)
-        result = deep_merge(system_config, app_config)
+        logger.info("config.merge.starting", system_path=os.fspath(system_path), app_path=os.fspath(app_path))
+        system_config, app_config = _load_configs([system_path, app_path])
+        # Both configs are fresh copies owned here, so subtrees can be shared
+        result = deep_merge(system_config, app_config, copy=False)
         logger.info("config.merge.complete", total_keys=len(result), system_keys=len(system_config), app_keys=len(app_config))
         return result
     except Exception as e:
@@ -408,4 +684,7 @@ def create_config_node(config: Dict[str, Any]) -> ConfigNode:
     Returns:
         ConfigNode for easy hierarchical access
     """
-    return ConfigNode(config)
\ No newline at end of file
+    return ConfigNode(config)
+
+# Bound last: c4h_agents.utils.logging imports create_config_node from here
+from c4h_agents.utils import logging as _logging_utils
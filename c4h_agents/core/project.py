@@ -7,15 +7,22 @@ Path: c4h_agents/core/project.py
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any
 import structlog
+import functools
+import os
 from datetime import datetime
 
 from c4h_agents.utils.logging import get_logger
 
 logger = get_logger()
 
-@dataclass
+@functools.lru_cache(maxsize=64)
+def _resolve_root(root: str) -> Path:
+    """Resolve an absolute project root once per process"""
+    return Path(root).resolve()
+
+@dataclass(slots=True, frozen=True)
 class ProjectPaths:
     """Standard project path definitions"""
     root: Path           # Project root directory (all paths relative to this)
@@ -29,16 +36,19 @@ class ProjectPaths:
         root = Path(config.get('project', {}).get('path', '.'))
         if not root.is_absolute():
             root = Path.cwd() / root
-        root = root.resolve()
+        root = _resolve_root(str(root))
         workspace = root / config.get('project', {}).get('workspace_root', 'workspaces')
         source = root / config.get('project', {}).get('source_root', '.')
         output = root / config.get('project', {}).get('output_root', '.')
         config_dir = root / config.get('project', {}).get('config_root', 'config')
-        workspace.mkdir(parents=True, exist_ok=True)
-        output.mkdir(parents=True, exist_ok=True)
+        # One stat per directory; a directory removed since the last call is
+        # created again
+        for directory in (workspace, output):
+            if not os.path.isdir(directory):
+                directory.mkdir(parents=True, exist_ok=True)
         return cls(root=root, workspace=workspace, source=source, output=output, config=config_dir)
 
-@dataclass 
+@dataclass(slots=True)
 class ProjectMetadata:
     """Project metadata and settings"""
     name: str
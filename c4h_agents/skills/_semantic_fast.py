@@ -3,32 +3,136 @@ Fast extraction mode implementation using standardized LLM response handling.
 Path: c4h_agents/skills/_semantic_fast.py
 """
 
-from typing import List, Dict, Any, Optional, Iterator, Union
+from typing import List, Dict, Any, Optional, Iterator, Union, Pattern
 from dataclasses import dataclass
 import json
+import re
+import copy
+import hashlib
+import functools
 from c4h_agents.agents.base_agent import BaseAgent, AgentResponse 
 from skills.shared.types import ExtractConfig
 from config import locate_config
 from c4h_agents.utils.logging import get_logger
+from c4h_agents.utils import json_utils
 
 logger = get_logger()
 
+# Anything other than printable ASCII or basic whitespace
+_UNSAFE_CHARS_RE = re.compile(r'[^\x20-\x7e\n\r\t]')
+
+# Byte table mapping the same unsafe characters to a space
+_SANITIZE_TABLE = bytes(b if 0x20 <= b <= 0x7e or b in b'\n\r\t' else 0x20 for b in range(256))
+
+def _sanitize(content: str) -> str:
+    """Replace each unsafe character with a space in a single pass"""
+    if content.isascii():
+        # One byte per character, so a byte table maps characters one-to-one
+        return content.encode('ascii').translate(_SANITIZE_TABLE).decode('ascii')
+    return _UNSAFE_CHARS_RE.sub(' ', content)
+
+# Last-resort recovery: objects and arrays nested at most one level deep
+_OBJECT_RE = re.compile(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}')
+_ARRAY_RE = re.compile(r'\[[^\[\]]*(?:\[[^\[\]]*\][^\[\]]*)*\]')
+_REGEX_RECOVERY_MAX_CHARS = 1_000_000
+
+# Bracket scanning jumps between structural characters and over string bodies
+_STRUCTURAL_RE = re.compile(r'[\[\]{}"]')
+_STRING_REST_RE = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.DOTALL)
+
+_DECODER = json.JSONDecoder()
+_SEPARATORS_RE = re.compile(r'[\s,]*')
+_NEXT_VALUE_RE = re.compile(r'[\[{]')
+
+def _decode_array_items(content: str) -> List[Any]:
+    """
+    Decode the object and array elements of the first top-level array one
+    at a time. A malformed element is skipped whole, up to its balanced
+    closing bracket, so none of its fragments are returned as items.
+    """
+    start = content.find('[')
+    if start < 0:
+        return []
+    items = []
+    idx = start + 1
+    length = len(content)
+    while True:
+        idx = _SEPARATORS_RE.match(content, idx).end()
+        if idx >= length or content[idx] == ']':
+            return items
+        try:
+            value, idx = _DECODER.raw_decode(content, idx)
+            if isinstance(value, (dict, list)):
+                items.append(value)
+        except json.JSONDecodeError:
+            if content[idx] in '{[':
+                end = _json_span_end(content, idx)
+                if end < 0:
+                    return items
+                idx = end + 1
+            else:
+                # A broken scalar: resume at the next element that opens a structure
+                resume = _NEXT_VALUE_RE.search(content, idx + 1)
+                if resume is None:
+                    return items
+                idx = resume.start()
+
+def _response_key(content: Any, config: ExtractConfig) -> bytes:
+    """Digest identifying an extraction request by content, instruction and format"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (content, config.instruction, config.format):
+        digest.update(str(part).encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.digest()
+
+@functools.lru_cache(maxsize=8)
+def _bracket_pattern(open_char: str, close_char: str) -> Pattern[str]:
+    """Pattern matching one bracket pair or a string opener"""
+    return re.compile('[' + re.escape(open_char + close_char) + '"]')
+
+def _json_span_end(content: str, start: int) -> int:
+    """
+    Find where the bracketed value opening at start closes, skipping
+    brackets inside string literals.
+
+    Returns:
+        Index of the closing bracket, or -1 if it never closes
+    """
+    depth = 0
+    pos = start
+    while True:
+        match = _STRUCTURAL_RE.search(content, pos)
+        if match is None:
+            return -1
+        index = match.start()
+        char = content[index]
+        if char == '"':
+            string_end = _STRING_REST_RE.match(content, index + 1)
+            if string_end is None:
+                return -1
+            pos = string_end.end()
+            continue
+        if char == '{' or char == '[':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return index
+        pos = index + 1
+
 class FastItemIterator:
     """Iterator for fast extraction results with indexing support"""
     def __init__(self, items: List[Any]):
         self._items = items if items else []
-        self._position = 0
+        # Position is held by the C-level list iterator shared by both protocols
+        self._it = iter(self._items)
         logger.debug("fast_iterator.initialized", items_count=len(self._items))
 
     def __iter__(self):
-        return self
+        return self._it
 
     def __next__(self):
-        if self._position >= len(self._items):
-            raise StopIteration
-        item = self._items[self._position]
-        self._position += 1
-        return item
+        return next(self._it)
 
     def __len__(self):
         """Support length checking"""
@@ -51,6 +155,18 @@ class FastExtractor(BaseAgent):
         
         # Get our config section
         fast_cfg = locate_config(self.config or {}, self._get_agent_name())
+        self._fast_cfg = fast_cfg
+
+        # Resolve the prompt once; a missing template still surfaces per request
+        try:
+            self._extract_template = self._get_prompt('extract')
+        except ValueError:
+            self._extract_template = None
+
+        # Parsed items of successful extractions keyed by request digest
+        self._cache_responses = bool(fast_cfg.get('cache_responses', True))
+        self._response_cache_size = int(fast_cfg.get('response_cache_size', 512))
+        self._response_cache: Dict[bytes, List[Any]] = {}
         
         logger.info("fast_extractor.initialized",
                    settings=fast_cfg)
@@ -64,7 +180,9 @@ class FastExtractor(BaseAgent):
             logger.error("fast_extractor.missing_config")
             raise ValueError("Extract config required")
 
-        extract_template = self._get_prompt('extract')
+        extract_template = self._extract_template
+        if extract_template is None:
+            extract_template = self._get_prompt('extract')
         return extract_template.format(
             content=context.get('content', ''),
             instruction=context['config'].instruction,
@@ -76,6 +194,15 @@ class FastExtractor(BaseAgent):
         try:
             logger.debug("fast_extractor.creating_iterator",
                         content_type=type(content).__name__)
+
+            # Serve repeated requests without another LLM call
+            cache_key = None
+            if self._cache_responses:
+                cache_key = _response_key(content, config)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    logger.info("fast_extraction.cache_hit", items_found=len(cached))
+                    return FastItemIterator(copy.deepcopy(cached))
                             
             # Use synchronous process instead of async
             result = self.process({
@@ -96,9 +223,9 @@ class FastExtractor(BaseAgent):
             try:
                 # Parse JSON with more robust error handling
                 if isinstance(extracted_content, str):
-                    # Find the specific offending character for debugging
+                    # Clean responses parse directly; only failures get sanitized
                     try:
-                        json.loads(extracted_content)
+                        items = json_utils.loads(extracted_content)
                     except json.JSONDecodeError as e:
                         problem_char = ord(extracted_content[e.pos]) if e.pos < len(extracted_content) else -1
                         logger.warning("fast_extraction.specific_char_issue", 
@@ -106,84 +233,9 @@ class FastExtractor(BaseAgent):
                                     char_code=problem_char,
                                     line=e.lineno, 
                                     column=e.colno)
-                    
-                    # More aggressive sanitization to handle ALL control and non-ASCII characters
-                    # Only keep printable ASCII (32-126) plus basic whitespace
-                    sanitized_content = ""
-                    for i, ch in enumerate(extracted_content):
-                        # Keep only safe characters: printable ASCII or basic whitespace
-                        if (32 <= ord(ch) <= 126) or ch in '\n\r\t':
-                            sanitized_content += ch
-                        else:
-                            # Replace with space and log the specific character that was removed
-                            sanitized_content += ' '
-                            if i >= 14720 and i <= 14740:  # Log only near the problematic area
-                                logger.debug("fast_extraction.removed_char", 
-                                        position=i, 
-                                        char_code=ord(ch))
-                    
-                    try:
-                        items = json.loads(sanitized_content)
-                        logger.info("fast_extraction.aggressive_sanitization_successful")
-                    except json.JSONDecodeError as e:
-                        # Try extracting partial valid JSON
-                        try:
-                            # For this specific case, try to directly cut the problem area
-                            # Assuming the start is valid JSON
-                            problem_area = max(0, e.pos - 100)
-                            before_problem = sanitized_content[:problem_area]
-                            after_problem = sanitized_content[e.pos + 100:]
-                            
-                            # Look for valid structural elements
-                            if before_problem.count('[') > before_problem.count(']'):
-                                # We're in an array, try to find a valid ]
-                                if ']' in after_problem:
-                                    end_pos = after_problem.find(']') + len(before_problem) + 100
-                                    patched_content = sanitized_content[:end_pos+1]
-                                    items = json.loads(patched_content)
-                                    logger.info("fast_extraction.array_patched_successfully", 
-                                            original_len=len(sanitized_content),
-                                            patched_len=len(patched_content))
-                                else:
-                                    return FastItemIterator([])
-                            else:
-                                # Try to extract valid objects
-                                objects = self._extract_valid_objects(sanitized_content)
-                                if objects:
-                                    items = objects
-                                else:
-                                    return FastItemIterator([])
-                        except Exception as recovery_err:
-                            logger.error("fast_extraction.recovery_failed", error=str(recovery_err))
-                            # Fall back to partial JSON extraction as last resort
-                            try:
-                                # Look for valid JSON objects using regex
-                                import re
-                                # Find objects between { and }
-                                object_pattern = re.compile(r'\{[^{}]*(\{[^{}]*\}[^{}]*)*\}')
-                                objects = [json.loads(m.group(0)) for m in object_pattern.finditer(sanitized_content)]
-                                
-                                # Find arrays between [ and ]
-                                array_pattern = re.compile(r'\[[^\[\]]*(\[[^\[\]]*\][^\[\]]*)*\]')
-                                arrays = [json.loads(m.group(0)) for m in array_pattern.finditer(sanitized_content)]
-                                
-                                if objects:
-                                    items = objects
-                                    logger.info("fast_extraction.regex_extracted_objects", 
-                                            count=len(objects))
-                                elif arrays:
-                                    array = arrays[0]
-                                    if isinstance(array, list):
-                                        items = array
-                                        logger.info("fast_extraction.regex_extracted_array", 
-                                                count=len(array))
-                                    else:
-                                        items = [array]
-                                else:
-                                    return FastItemIterator([])
-                            except Exception:
-                                logger.error("fast_extraction.all_recovery_methods_failed")
-                                return FastItemIterator([])
+                        items = self._recover_items(extracted_content)
+                        if items is None:
+                            return FastItemIterator([])
                 else:
                     items = extracted_content
                     
@@ -194,6 +246,8 @@ class FastExtractor(BaseAgent):
                     items = []
                     
                 logger.info("fast_extraction.complete", items_found=len(items))
+                if cache_key is not None and items:
+                    self._store_response(cache_key, items)
                 return FastItemIterator(items)
 
             except json.JSONDecodeError as e:
@@ -203,6 +257,80 @@ class FastExtractor(BaseAgent):
         except Exception as e:
             logger.error("fast_extraction.failed", error=str(e))
             return FastItemIterator([])
+
+    def _store_response(self, cache_key: bytes, items: List[Any]) -> None:
+        """Cache a copy of extracted items, evicting the oldest entry when full"""
+        if self._response_cache_size <= 0:
+            return
+        if len(self._response_cache) >= self._response_cache_size:
+            del self._response_cache[next(iter(self._response_cache))]
+        self._response_cache[cache_key] = copy.deepcopy(items)
+
+    def _recover_items(self, extracted_content: str) -> Optional[Any]:
+        """Recover JSON from a response that failed to parse as-is; None if nothing usable"""
+        # More aggressive sanitization to handle ALL control and non-ASCII characters
+        # Only keep printable ASCII (32-126) plus basic whitespace
+        sanitized_content = _sanitize(extracted_content)
+        
+        try:
+            items = json_utils.loads(sanitized_content)
+            logger.info("fast_extraction.aggressive_sanitization_successful")
+            return items
+        except json.JSONDecodeError as e:
+            # Try extracting partial valid JSON
+            try:
+                # For this specific case, try to directly cut the problem area
+                # Assuming the start is valid JSON
+                problem_area = max(0, e.pos - 100)
+                before_problem = sanitized_content[:problem_area]
+                
+                # Look for valid structural elements
+                if before_problem.count('[') > before_problem.count(']'):
+                    # We're in an array: decode its elements one at a time,
+                    # resuming at the next bracket after a broken one
+                    items = _decode_array_items(sanitized_content)
+                    if not items:
+                        raise ValueError("no array items recovered")
+                    logger.info("fast_extraction.array_items_recovered", 
+                            original_len=len(sanitized_content),
+                            items=len(items))
+                    return items
+                # Try to extract valid objects
+                objects = self._extract_valid_objects(sanitized_content)
+                return objects if objects else None
+            except Exception as recovery_err:
+                logger.error("fast_extraction.recovery_failed", error=str(recovery_err))
+                # Fall back to partial JSON extraction as last resort
+                try:
+                    # Rescanning per opening bracket is quadratic on runaway input
+                    if len(sanitized_content) > _REGEX_RECOVERY_MAX_CHARS:
+                        logger.error("fast_extraction.all_recovery_methods_failed",
+                                   reason="content_too_large_for_regex_recovery",
+                                   length=len(sanitized_content))
+                        return None
+
+                    # Look for valid JSON objects using regex
+                    # Find objects between { and }
+                    objects = [json_utils.loads(m.group(0)) for m in _OBJECT_RE.finditer(sanitized_content)]
+                    
+                    # Find arrays between [ and ]
+                    arrays = [json_utils.loads(m.group(0)) for m in _ARRAY_RE.finditer(sanitized_content)]
+                    
+                    if objects:
+                        logger.info("fast_extraction.regex_extracted_objects", 
+                                count=len(objects))
+                        return objects
+                    if arrays:
+                        array = arrays[0]
+                        if isinstance(array, list):
+                            logger.info("fast_extraction.regex_extracted_array", 
+                                    count=len(array))
+                            return array
+                        return [array]
+                    return None
+                except Exception:
+                    logger.error("fast_extraction.all_recovery_methods_failed")
+                    return None
             
     def _extract_valid_objects(self, content: str) -> List[Dict]:
         """Extract valid JSON objects even from malformed JSON"""
@@ -218,38 +346,22 @@ class FastExtractor(BaseAgent):
             if obj_start < 0 and arr_start < 0:
                 break  # No more JSON structures
             
-            if (obj_start >= 0 and arr_start >= 0 and obj_start < arr_start) or arr_start < 0:
-                # Object starts first
-                start_pos = obj_start
-                for end_pos in range(start_pos + 1, len(content)):
-                    # Try parsing this substring
-                    try:
-                        obj = json.loads(content[start_pos:end_pos+1])
-                        objects.append(obj)
-                        start_idx = end_pos + 1
-                        break
-                    except json.JSONDecodeError:
-                        continue
-                else:
-                    start_idx = len(content)  # No valid object found
-                    
+            start_pos = obj_start if (obj_start >= 0 and arr_start >= 0 and obj_start < arr_start) or arr_start < 0 else arr_start
+
+            # A valid value starting here can only end at its balanced closing
+            # bracket, so one parse of that span settles it
+            end_pos = _json_span_end(content, start_pos)
+            if end_pos < 0:
+                break  # No valid structure found
+            try:
+                value = json_utils.loads(content[start_pos:end_pos+1])
+            except json.JSONDecodeError:
+                break  # No valid structure found
+            if start_pos == arr_start and isinstance(value, list):
+                objects.extend(value)
             else:
-                # Array starts first
-                start_pos = arr_start
-                for end_pos in range(start_pos + 1, len(content)):
-                    # Try parsing this substring
-                    try:
-                        arr = json.loads(content[start_pos:end_pos+1])
-                        if isinstance(arr, list):
-                            objects.extend(arr)
-                        else:
-                            objects.append(arr)
-                        start_idx = end_pos + 1
-                        break
-                    except json.JSONDecodeError:
-                        continue
-                else:
-                    start_idx = len(content)  # No valid array found
+                objects.append(value)
+            start_idx = end_pos + 1
         
         return objects
             
@@ -265,7 +377,7 @@ class FastExtractor(BaseAgent):
                 # Try to parse this segment as JSON
                 try:
                     obj_text = text[object_start:object_end+1]
-                    obj = json.loads(obj_text)
+                    obj = json_utils.loads(obj_text)
                     objects.append(obj)
                     logger.debug("fast_extraction.object_extracted", 
                                start=object_start,
@@ -288,7 +400,7 @@ class FastExtractor(BaseAgent):
             if array_end > array_start:
                 try:
                     array_text = text[array_start:array_end+1]
-                    array = json.loads(array_text)
+                    array = json_utils.loads(array_text)
                     if isinstance(array, list) and array:
                         # If we found a valid array, return its elements
                         objects.extend(array)
@@ -305,13 +417,26 @@ class FastExtractor(BaseAgent):
     def _find_matching_bracket(self, text: str, start_pos: int, 
                               open_char: str = '{', close_char: str = '}') -> int:
         """Find the matching closing bracket position for a given opening bracket"""
-        stack = []
-        for i in range(start_pos, len(text)):
-            if text[i] == open_char:
-                stack.append(i)
-            elif text[i] == close_char:
-                if stack:
-                    stack.pop()
-                    if not stack:
-                        return i  # This is the matching closing bracket
-        return -1  # No matching bracket found
\ No newline at end of file
+        # Depth counter only; brackets inside string literals are skipped
+        pattern = _bracket_pattern(open_char, close_char)
+        depth = 0
+        pos = start_pos
+        while True:
+            match = pattern.search(text, pos)
+            if match is None:
+                return -1  # No matching bracket found
+            index = match.start()
+            char = text[index]
+            if char == '"':
+                string_end = _STRING_REST_RE.match(text, index + 1)
+                if string_end is None:
+                    return -1
+                pos = string_end.end()
+                continue
+            if char == open_char:
+                depth += 1
+            elif depth:
+                depth -= 1
+                if not depth:
+                    return index  # This is the matching closing bracket
+            pos = index + 1
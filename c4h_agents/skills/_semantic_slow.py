@@ -3,14 +3,47 @@ Slow extraction mode with lazy LLM calls.
 Path: c4h_agents/skills/_semantic_slow.py
 """
 
-from typing import Dict, Any, Optional 
+from typing import Dict, Any, Optional, List, Tuple
 from c4h_agents.agents.base_agent import BaseAgent, AgentResponse 
 from skills.shared.types import ExtractConfig
 import json
+import copy
+import hashlib
+import string
 from config import locate_config
 from c4h_agents.utils.logging import get_logger
 
 logger = get_logger()
+
+# Suffix by last digit; 11th-13th are handled separately
+_ORDINAL_SUFFIX = ('th', 'st', 'nd', 'rd', 'th', 'th', 'th', 'th', 'th', 'th')
+
+def _ordinal(n: int) -> str:
+    """Generate ordinal string for a number"""
+    if 11 <= n % 100 <= 13:
+        return f"{n}th"
+    return f"{n}{_ORDINAL_SUFFIX[n % 10]}"
+
+# Stands in for the ordinal while a prompt is rendered once per content
+_ORDINAL_MARK = '\x00ordinal\x00'
+
+def _plain_ordinal_fields(template: str) -> bool:
+    """True if every {ordinal} field in template has no conversion or format spec"""
+    try:
+        return all(not spec and conversion is None
+                   for _, field, spec, conversion in string.Formatter().parse(template)
+                   if field == 'ordinal')
+    except ValueError:
+        return False
+
+def _response_key(content: Any, config: ExtractConfig, position: int) -> bytes:
+    """Digest identifying a single-item request by content, instruction, format and position"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (content, config.instruction, config.format, position):
+        digest.update(str(part).encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.digest()
+
 class ExtractionError(Exception):
     """Custom exception for extraction errors"""
     pass
@@ -35,25 +68,20 @@ class SlowItemIterator:
         self._position = 0
         self._exhausted = False
         self._max_attempts = 10 # Safety limit
-        self._returned_items = set()  # Track returned items
+        self._returned_items = set()  # Digests of returned items
         self._current_attempt = 0  # Track retries for current position
 
     def __iter__(self):
         return self
 
-    def _get_content_key(self, content: Dict[str, Any]) -> str:
-        """Get unique key for content based on full definition"""
+    def _get_content_key(self, content: Any) -> bytes:
+        """Get unique key for content as a digest of its canonical JSON form"""
         try:
-            if isinstance(content, dict):
-                # Sort the content for consistent string representation
-                items = []
-                for k in sorted(content.keys()):
-                    items.append(f"{k}:{content[k]}")
-                return "|".join(items)
-            return str(content)
+            canonical = json.dumps(content, sort_keys=True, separators=(',', ':'), default=str)
         except Exception as e:
             logger.error("iterator.key_generation_failed", error=str(e))
-            return str(content)
+            canonical = str(content)
+        return hashlib.blake2b(canonical.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
 
     def __next__(self) -> Any:
         """Get next item using lazy extraction"""
@@ -72,22 +100,32 @@ class SlowItemIterator:
             raise StopIteration
 
         try:
-            # Run extraction using the extractor instance
-            agent_response = self._extractor.process({
-                'content': self._content,
-                'config': self._config,
-                'position': self._position
-            })
-
-            if not agent_response.success:
-                logger.error("slow_iterator.extraction_failed", 
-                            error=agent_response.error,
-                            position=self._position)
-                self._exhausted = True
-                raise StopIteration
+            # Only a first attempt may reuse an earlier answer; retries ask the LLM
+            cache_key = None
+            content = None
+            if self._extractor._cache_responses and self._current_attempt == 0:
+                cache_key = _response_key(self._content, self._config, self._position)
+                content = self._extractor._cached_response(cache_key)
+
+            if content is not None:
+                logger.debug("slow_iterator.cache_hit", position=self._position)
+            else:
+                # Run extraction using the extractor instance
+                agent_response = self._extractor.process({
+                    'content': self._content,
+                    'config': self._config,
+                    'position': self._position
+                })
+
+                if not agent_response.success:
+                    logger.error("slow_iterator.extraction_failed", 
+                                error=agent_response.error,
+                                position=self._position)
+                    self._exhausted = True
+                    raise StopIteration
 
-            # Get response content from standard location
-            content = agent_response.data.get('response')
+                # Get response content from standard location
+                content = agent_response.data.get('response')
 
             logger.debug("slow_iterator.response",
                         position=self._position,
@@ -111,6 +149,8 @@ class SlowItemIterator:
             if isinstance(content, str) and content.strip().upper() == "NO_MORE_ITEMS":
                 logger.info("slow_iterator.no_more_items", 
                         position=self._position)
+                if cache_key is not None:
+                    self._extractor._store_response(cache_key, content)
                 self._exhausted = True
                 raise StopIteration
 
@@ -140,6 +180,8 @@ class SlowItemIterator:
 
             # Success - update state
             self._returned_items.add(content_key)
+            if cache_key is not None:
+                self._extractor._store_response(cache_key, content)
             self._position += 1
             self._current_attempt = 0  # Reset attempt counter for next position
 
@@ -166,6 +208,7 @@ class SlowExtractor(BaseAgent):
         
         # Get our config section
         slow_cfg = locate_config(self.config or {}, self._get_agent_name())
+        self._slow_cfg = slow_cfg
         
         # Validate template at initialization
         template = self._get_prompt('extract')
@@ -173,6 +216,14 @@ class SlowExtractor(BaseAgent):
             logger.error("slow_extractor.invalid_template", 
                         reason="Missing {ordinal} placeholder")
             raise ValueError("Slow extractor requires {ordinal} in prompt template")
+        self._extract_template = template
+        self._plain_template = _plain_ordinal_fields(template)
+        self._prompt_memo: Optional[Tuple[str, Tuple[str, str], Optional[List[str]]]] = None
+
+        # Accepted per-position answers keyed by request digest
+        self._cache_responses = bool(slow_cfg.get('cache_responses', True))
+        self._response_cache_size = int(slow_cfg.get('response_cache_size', 512))
+        self._response_cache: Dict[bytes, Any] = {}
 
         logger.info("slow_extractor.initialized",
                    settings=slow_cfg)
@@ -180,6 +231,19 @@ class SlowExtractor(BaseAgent):
     def _get_agent_name(self) -> str:
         return "semantic_slow_extractor"
 
+    def _cached_response(self, cache_key: bytes) -> Any:
+        """Return a copy of a cached answer, or None on a miss"""
+        cached = self._response_cache.get(cache_key)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _store_response(self, cache_key: bytes, content: Any) -> None:
+        """Cache a copy of an accepted answer, evicting the oldest entry when full"""
+        if self._response_cache_size <= 0:
+            return
+        if len(self._response_cache) >= self._response_cache_size:
+            del self._response_cache[next(iter(self._response_cache))]
+        self._response_cache[cache_key] = copy.deepcopy(content)
+
     def _format_request(self, context: Dict[str, Any]) -> str:
         """Format extraction request for slow mode using config template"""
         if not context.get('config'):
@@ -188,17 +252,14 @@ class SlowExtractor(BaseAgent):
 
         position = context.get('position', 0)
         ordinal = self._get_ordinal(position + 1)
-        
-        # Format instruction with ordinal
-        instruction = context['config'].instruction.format(ordinal=ordinal)
+        content = context.get('content', '')
 
-        # Format complete request using template
-        request = self._get_prompt('extract').format(
-            ordinal=ordinal,
-            content=context.get('content', ''),
-            instruction=instruction,
-            format=context['config'].format
-        )
+        # Only the ordinal changes between positions, so join pre-rendered parts
+        parts = self._prompt_parts(content, context['config'])
+        if parts is not None:
+            request = ordinal.join(parts)
+        else:
+            request = self._render_request(content, context['config'], ordinal)
 
         logger.debug("slow_extractor.request",
                    position=position,
@@ -207,11 +268,44 @@ class SlowExtractor(BaseAgent):
 
         return request
 
+    def _render_request(self, content: Any, config: ExtractConfig, ordinal: str) -> str:
+        """Render the complete request for one ordinal"""
+        # Format instruction with ordinal
+        instruction = config.instruction.format(ordinal=ordinal)
+
+        # Format complete request using template
+        return self._extract_template.format(
+            ordinal=ordinal,
+            content=content,
+            instruction=instruction,
+            format=config.format
+        )
+
+    def _prompt_parts(self, content: Any, config: ExtractConfig) -> Optional[List[str]]:
+        """
+        Request text split around each ordinal, rendered once per content/config pair.
+        Returns None when the prompt cannot be split safely.
+        """
+        if not self._plain_template or not isinstance(content, str):
+            return None
+        key = (config.instruction, config.format)
+        memo = self._prompt_memo
+        if memo is not None and memo[0] is content and memo[1] == key:
+            return memo[2]
+
+        parts = None
+        if (_plain_ordinal_fields(config.instruction)
+                and _ORDINAL_MARK not in content
+                and _ORDINAL_MARK not in config.instruction
+                and _ORDINAL_MARK not in str(config.format)):
+            parts = self._render_request(content, config, _ORDINAL_MARK).split(_ORDINAL_MARK)
+        self._prompt_memo = (content, key, parts)
+        return parts
+
     @staticmethod
     def _get_ordinal(n: int) -> str:
         """Generate ordinal string for a number"""
-        suffix = {1: 'st', 2: 'nd', 3: 'rd'}.get(n % 10 if n % 100 not in [11, 12, 13] else 0, 'th')
-        return f"{n}{suffix}"
+        return _ordinal(n)
 
     def create_iterator(self, content: Any, config: ExtractConfig) -> SlowItemIterator:
         """Create iterator for slow extraction"""
@@ -0,0 +1,51 @@
+"""
+JSON encoding helpers using orjson when available.
+Path: c4h_agents/utils/json_utils.py
+"""
+
+from typing import Any, Callable, Optional, Union
+import json
+
+# Try importing orjson, but don't fail if it's not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+def dumps(obj: Any, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """
+    Serialize an object to a JSON string.
+
+    Args:
+        obj: Object to serialize
+        indent: Pretty-print with two-space indentation
+        default: Fallback serializer for unsupported types
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=default, option=option).decode('utf-8')
+        except TypeError:
+            pass  # Values orjson cannot encode (e.g. oversized ints) use stdlib
+    return json.dumps(obj, indent=2 if indent else None, default=default)
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document from str or bytes.
+
+    Raises:
+        json.JSONDecodeError: If the document is not valid JSON
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # Stdlib also accepts NaN/Infinity and lone surrogates
+    return json.loads(data)
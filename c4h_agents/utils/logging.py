@@ -3,7 +3,7 @@ Central logging utility with configurable truncation.
 Path: c4h_agents/utils/logging.py
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 import structlog
 from c4h_agents.config import create_config_node
 
@@ -14,6 +14,30 @@ DEFAULT_SUFFIX_LENGTH = 50
 # Global configuration cache
 _global_config = {}
 
+# Truncation lengths resolved from the global configuration
+_global_lengths: Tuple[int, int] = (DEFAULT_PREFIX_LENGTH, DEFAULT_SUFFIX_LENGTH)
+
+# Whether debug events are wanted, resolved from logging.level; events are
+# emitted until a configuration says otherwise
+_global_debug: bool = True
+
+def _resolve_lengths(config: Dict[str, Any]) -> Tuple[int, int]:
+    """Read (prefix, suffix) truncation lengths from configuration"""
+    config_node = create_config_node(config)
+    return (
+        config_node.get_value("logging.truncate.prefix_length") or DEFAULT_PREFIX_LENGTH,
+        config_node.get_value("logging.truncate.suffix_length") or DEFAULT_SUFFIX_LENGTH
+    )
+
+def _resolve_debug(config: Dict[str, Any]) -> bool:
+    """Read whether logging.level enables debug events"""
+    level = create_config_node(config).get_value("logging.level")
+    return level is None or str(level).upper() == "DEBUG"
+
+def debug_enabled() -> bool:
+    """Whether debug events are wanted under the global configuration"""
+    return _global_debug
+
 def initialize_logging_config(config: Dict[str, Any]) -> None:
     """
     Initialize global logging configuration.
@@ -21,8 +45,11 @@ def initialize_logging_config(config: Dict[str, Any]) -> None:
     Args:
         config: Complete configuration dictionary
     """
-    global _global_config
+    global _global_config, _global_lengths, _global_debug
     _global_config = config.copy() if config else {}
+    _global_lengths = (_resolve_lengths(_global_config) if _global_config
+                       else (DEFAULT_PREFIX_LENGTH, DEFAULT_SUFFIX_LENGTH))
+    _global_debug = _resolve_debug(_global_config) if _global_config else True
 
 def truncate_log_string(
     value: Any, 
@@ -51,14 +78,12 @@ def truncate_log_string(
         if suffix_len is None:
             suffix_len = config_node.get_value("logging.truncate.suffix_length") or DEFAULT_SUFFIX_LENGTH
     else:
-        # Use global config if available, otherwise use defaults
-        global _global_config
+        # Use lengths resolved from global config if available, otherwise use defaults
         if _global_config:
-            config_node = create_config_node(_global_config)
             if prefix_len is None:
-                prefix_len = config_node.get_value("logging.truncate.prefix_length") or DEFAULT_PREFIX_LENGTH
+                prefix_len = _global_lengths[0]
             if suffix_len is None:
-                suffix_len = config_node.get_value("logging.truncate.suffix_length") or DEFAULT_SUFFIX_LENGTH
+                suffix_len = _global_lengths[1]
         else:
             # Default values if no config provided
             prefix_len = prefix_len or DEFAULT_PREFIX_LENGTH
@@ -8,13 +8,19 @@ import structlog
 from enum import Enum
 import logging.config
 from dataclasses import dataclass
+from copy import deepcopy
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from pathlib import Path
 import argparse
+import ast
+import functools
+import importlib
 import yaml
 import json
+import os
+import re
 import sys
 
 # Add source directory to path
@@ -22,19 +28,39 @@ root_dir = Path(__file__).parent.parent
 sys.path.append(str(root_dir / 'src'))
 
 from agents.base import BaseAgent, LogDetail
-from agents.coder import Coder
-from skills.semantic_iterator import SemanticIterator
-from skills.semantic_merge import SemanticMerge
-from skills.shared.types import ExtractConfig
-from agents.discovery import DiscoveryAgent
-from agents.solution_designer import SolutionDesigner
-from skills.asset_manager import AssetManager
-from skills.semantic_merge import SemanticMerge
-from skills.semantic_extract import SemanticExtract
-from config import deep_merge
+from c4h_agents.utils import json_utils
+from config import deep_merge, load_config
 
 logger = structlog.get_logger()
 
+# Prefer the libyaml-backed loader, falling back to the pure-Python parser
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# Escape sequences LLM output often carries literally
+_ESCAPES = {'\\n': '\n', '\\t': '\t', '\\"': '"'}
+_ESCAPE_RE = re.compile(r'\\[nt"]')
+
+def _unescape(match: re.Match) -> str:
+    return _ESCAPES[match.group()]
+
+# System config candidates, searched in order
+_SYSTEM_CONFIG_PATHS = (
+    Path("config/system_config.yml"),
+    Path("../config/system_config.yml"),
+    Path(__file__).parent.parent / "config" / "system_config.yml"
+)
+
+@functools.lru_cache(maxsize=None)
+def _find_system_config() -> Optional[Path]:
+    """First existing system config path, looked up once per process"""
+    for path in _SYSTEM_CONFIG_PATHS:
+        if os.path.exists(path):
+            return path
+    return None
+
 class LogMode(str, Enum):
     """Logging modes supported by harness"""
     DEBUG = "debug"     # Maps to LogDetail.DEBUG
@@ -48,16 +74,30 @@ class LogMode(str, Enum):
             LogMode.NORMAL: LogDetail.BASIC
         }[self]
 
+_PARAM_CONSTANTS = {'True': True, 'False': False, 'None': None}
+
+def _is_plain_int(value: str) -> bool:
+    """Whether literal_eval would read value as a plain decimal int"""
+    digits = value[1:] if value[:1] == '-' else value
+    # Long digit strings are left to literal_eval and its int size limit
+    return (len(digits) < 20 and digits.isascii() and digits.isdigit()
+            and (digits == '0' or digits[0] != '0'))
+
 def parse_param(param_str: str) -> tuple[str, Any]:
     """Parse a parameter string in format key=value"""
     try:
         key, value = param_str.split('=', 1)
-        # Try to interpret as Python literal (for bool, int, etc)
-        try:
-            import ast
-            value = ast.literal_eval(value)
-        except (ValueError, SyntaxError):
-            pass  # Keep as string if not a valid Python literal
+        # Common scalars are decoded directly; anything else is tried as a
+        # Python literal (lists, dicts, floats, quoted strings)
+        if value in _PARAM_CONSTANTS:
+            value = _PARAM_CONSTANTS[value]
+        elif _is_plain_int(value):
+            value = int(value)
+        elif not value.isidentifier():
+            try:
+                value = ast.literal_eval(value)
+            except (ValueError, SyntaxError):
+                pass  # Keep as string if not a valid Python literal
         return key.strip(), value
     except ValueError:
         raise ValueError(f"Invalid parameter format: {param_str}. Use key=value format")
@@ -72,21 +112,25 @@ class AgentConfig:
 class AgentTestHarness:
     """Generic test harness for running agent classes"""
     
-    # Registry of supported agent types
+    # Registry of supported agent types as (module, class); classes are
+    # imported on first use so a run only loads the agent it needs
     AGENT_TYPES = {
-        "coder": Coder,
-        "semantic_iterator": SemanticIterator,
-        "semantic_merge": SemanticMerge,
-        "semantic_extract": SemanticExtract,
-        "discovery": DiscoveryAgent,
-        "solution_designer": SolutionDesigner,
-        "asset_manager": AssetManager
+        "coder": ("agents.coder", "Coder"),
+        "semantic_iterator": ("skills.semantic_iterator", "SemanticIterator"),
+        "semantic_merge": ("skills.semantic_merge", "SemanticMerge"),
+        "semantic_extract": ("skills.semantic_extract", "SemanticExtract"),
+        "discovery": ("agents.discovery", "DiscoveryAgent"),
+        "solution_designer": ("agents.solution_designer", "SolutionDesigner"),
+        "asset_manager": ("skills.asset_manager", "AssetManager")
     }
+    _loaded: Dict[str, type] = {}
 
     def __init__(self, console: Optional[Console] = None):
         self.console = console or Console()
         # Remove default project root assumption
         self.project_root = None
+        # Merged configs keyed by test config path and source mtimes
+        self._merged_configs: Dict[tuple, Dict[str, Any]] = {}
         
     def setup_logging(self, mode: LogMode) -> None:
         """Configure structured logging based on mode"""
@@ -103,7 +147,8 @@ class AgentTestHarness:
                 structlog.dev.ConsoleRenderer(colors=True)
             ])
         else:
-            processors.append(structlog.processors.JSONRenderer(indent=2))
+            # orjson-backed serializer when available; large events dominate debug runs
+            processors.append(structlog.processors.JSONRenderer(serializer=json_utils.dumps, indent=2))
 
         structlog.configure(
             processors=processors,
@@ -131,11 +176,22 @@ class AgentTestHarness:
     def load_configs(self, test_config_path: str) -> Dict[str, Any]:
         """Load and merge configurations"""
         try:
+            system_path = _find_system_config()
+            cache_key = (
+                test_config_path,
+                os.stat(test_config_path).st_mtime_ns,
+                os.stat(system_path).st_mtime_ns if system_path is not None else None
+            )
+            cached = self._merged_configs.get(cache_key)
+            if cached is not None:
+                # Agents write into their config, so each run gets its own copy
+                return deepcopy(cached)
+
             system_config = self._load_system_config()
             
             # Load test config using yaml
             with open(test_config_path) as f:
-                test_config = yaml.safe_load(f)
+                test_config = yaml.load(f, Loader=_SafeLoader)
 
             # Get project paths from test config, not execution location
             if 'project' in test_config:
@@ -147,10 +203,11 @@ class AgentTestHarness:
                 if 'default_path' in project_config:
                     project_config['default_path'] = Path(project_config['default_path']).resolve()
 
-            # Merge configs using deep_merge
-            config = deep_merge(system_config, test_config)
+            # Merge configs using deep_merge; both inputs are fresh copies
+            config = deep_merge(system_config, test_config, copy=False)
+            self._merged_configs[cache_key] = config
             
-            return config
+            return deepcopy(config)
         except Exception as e:
             logger.error("testharness.config_load_failed", error=str(e))
             raise
@@ -158,21 +215,14 @@ class AgentTestHarness:
     def _load_system_config(self) -> Dict[str, Any]:
         """Load system configuration file"""
         try:
-            # Find system config path
-            system_config_paths = [
-                Path("config/system_config.yml"),
-                Path("../config/system_config.yml"),
-                Path(__file__).parent.parent / "config" / "system_config.yml"
-            ]
-            
-            for path in system_config_paths:
-                if path.exists():
-                    logger.info("config.loading", path=str(path))
-                    with open(path) as f:
-                        return yaml.safe_load(f)
+            path = _find_system_config()
+            if path is not None:
+                logger.info("config.loading", path=os.fspath(path))
+                # Cached by path and mtime, so repeated agent runs skip the parse
+                return load_config(path)
                     
             logger.warning("config.no_system_config_found", 
-                        paths=[str(p) for p in system_config_paths])
+                        paths=[os.fspath(p) for p in _SYSTEM_CONFIG_PATHS])
             return {}
 
         except Exception as e:
@@ -184,7 +234,11 @@ class AgentTestHarness:
         if agent_type not in self.AGENT_TYPES:
             raise ValueError(f"Unsupported agent type: {agent_type}")
                 
-        agent_class = self.AGENT_TYPES[agent_type]
+        agent_class = self._loaded.get(agent_type)
+        if agent_class is None:
+            module_path, class_name = self.AGENT_TYPES[agent_type]
+            agent_class = getattr(importlib.import_module(module_path), class_name)
+            self._loaded[agent_type] = agent_class
         return agent_class(config=config)
 
     def process_agent(self, config: AgentConfig) -> None:
@@ -205,8 +259,9 @@ class AgentTestHarness:
             # Get any extra parameters passed via command line
             extra_params = config.extra_args or {}
                 
-            if isinstance(agent, SemanticIterator):
+            if config.agent_type == "semantic_iterator":
                 # Handle iterator case
+                from skills.shared.types import ExtractConfig
                 extract_config = ExtractConfig(
                     instruction=configs.get('instruction'),
                     format=configs.get('format', 'json')
@@ -284,14 +339,13 @@ class AgentTestHarness:
             # Convert to string
             content = str(data)
             
-            # Handle escaped newlines and indentation
-            content = content.replace('\\n', '\n')
-            content = content.replace('\\t', '\t')
-            content = content.replace('\\"', '"')
+            # Handle escaped newlines, indentation and quotes in one pass
+            if '\\' in content:
+                content = _ESCAPE_RE.sub(_unescape, content)
             
             # Strip any markdown code block markers
             if content.startswith('```') and content.endswith('```'):
-                content = '\n'.join(content.split('\n')[1:-1])
+                content = content.partition('\n')[2].rpartition('\n')[0]
                 
             return content
             
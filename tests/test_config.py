@@ -0,0 +1,44 @@
+"""
+Tests for configuration merging.
+Path: tests/test_config.py
+"""
+
+import sys
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+
+from c4h_agents.config import deep_merge
+
+
+ALIASED_SYSTEM_CONFIG = """
+defaults: &d
+  model: base-model
+  since: 2024-01-01
+llm_config:
+  agents:
+    coder: *d
+    discovery: *d
+"""
+
+
+def test_deep_merge_does_not_write_through_yaml_aliases():
+    """Overrides and runtime values land only on the path they target"""
+    import yaml
+
+    override = {
+        'llm_config': {'agents': {'coder': {'model': 'app-model'}}},
+        'intent': {'description': 'refactor'}
+    }
+    for copy in (True, False):
+        base = yaml.safe_load(ALIASED_SYSTEM_CONFIG)
+        result = deep_merge(base, override, copy=copy)
+        agents = result['llm_config']['agents']
+
+        assert agents['coder']['model'] == 'app-model'
+        assert agents['discovery']['model'] == 'base-model'
+        assert result['defaults'] == {'model': 'base-model', 'since': base['defaults']['since']}
+        assert agents['discovery']['intent'] == {'description': 'refactor'}
+        assert 'intent' not in result['defaults']
+        assert base['defaults'] == result['defaults']
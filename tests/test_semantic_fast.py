@@ -0,0 +1,30 @@
+"""
+Tests for fast extraction response recovery.
+Path: tests/test_semantic_fast.py
+"""
+
+import sys
+from pathlib import Path
+
+root_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(root_dir))
+sys.path.insert(0, str(root_dir / 'c4h_agents'))
+
+from c4h_agents.skills._semantic_fast import _decode_array_items
+
+
+def test_decode_array_items_skips_broken_element_whole():
+    """Fragments of a malformed element never surface as items"""
+    content = ('[{"file_path": "z.py", "type": "modify"}, '
+               '{"file_path": "a.py", "meta": {"type": "create"}, "diff": oops}, '
+               '{"file_path": "b.py"}]')
+
+    assert _decode_array_items(content) == [
+        {'file_path': 'z.py', 'type': 'modify'},
+        {'file_path': 'b.py'}
+    ]
+
+
+def test_decode_array_items_keeps_only_structured_elements():
+    """Scalar elements are dropped; decoding resumes after a broken scalar"""
+    assert _decode_array_items('[1, "s", {"a": 1}, oops, {"b": 2}]') == [{'a': 1}, {'b': 2}]